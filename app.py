@@ -1,38 +1,52 @@
 import dash
 from dash import html, dcc, callback_context
 import dash_bootstrap_components as dbc
-from dash.dependencies import Input, Output, State
-import base64
+from dash.dependencies import Input, Output, State, MATCH
+import functools
+import gc
+import gzip
+import hashlib
+import json
+import logging
+import mimetypes
 import os
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import flask
 import re
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from urllib.parse import quote, urlsplit
 from dotenv import load_dotenv
+from plotly.io.json import to_json_plotly
+from werkzeug.middleware.proxy_fix import ProxyFix
+from werkzeug.security import safe_join
 
+try:
+    import brotli
+except ImportError:  # responses fall back to gzip
+    brotli = None
 
 
-# Initialize the Dash app with a more attractive Bootstrap theme (Flatly from Bootswatch)
-app = dash.Dash(__name__, external_stylesheets=[
-    dbc.themes.FLATLY,  # Changed from BOOTSTRAP to FLATLY for a more modern look
-    'https://use.fontawesome.com/releases/v5.15.4/css/all.css',
-    'https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600;700&display=swap',
-    'assets/custom.css'
-], suppress_callback_exceptions=True)
+
+# Initialize the Dash app. The Bootstrap theme (Flatly from Bootswatch), icons
+# and fonts are added with the stylesheet bundle further down.
+app = dash.Dash(__name__, suppress_callback_exceptions=True,
+                assets_ignore=r'\.(js|css)$')  # assets go out as fingerprinted bundles, see BUNDLES
 server = app.server
 
-# Fix script loading issue by using a proper external_scripts parameter
-app.scripts.config.serve_locally = False  # Don't serve locally if it doesn't exist
-app._external_scripts = [
-    {'src': 'https://code.jquery.com/jquery-3.6.0.min.js'},
-    {'src': 'https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js'}
-]
+# Serve Dash's own React and component scripts from this server, not unpkg
+app.scripts.config.serve_locally = True
+app.css.config.serve_locally = True
 
 # Configure for deployment
 app.title = "Seye Daniel Oyelayo - Professional Portfolio"
 
-# Use custom HTML template to add smooth scrolling
+# Page template
 app.index_string = '''
 <!DOCTYPE html>
 <html>
@@ -41,12 +55,6 @@ app.index_string = '''
         <title>{%title%}</title>
         {%favicon%}
         {%css%}
-        <style>
-            html {
-                scroll-behavior: smooth;
-                scroll-padding-top: 80px;
-            }
-        </style>
     </head>
     <body>
         {%app_entry%}
@@ -54,41 +62,6 @@ app.index_string = '''
             {%config%}
             {%scripts%}
             {%renderer%}
-            <script>
-                document.addEventListener('DOMContentLoaded', function() {
-                    // Add click handlers for navigation links
-                    document.addEventListener('click', function(e) {
-                        // Find closest anchor tag
-                        const link = e.target.closest('a');
-
-                        // Check if it's an internal hash link
-                        if (link && link.getAttribute('href') && link.getAttribute('href').startsWith('#')) {
-                            e.preventDefault();
-                            const targetId = link.getAttribute('href').substring(1);
-                            const targetElement = document.getElementById(targetId);
-                            if (targetElement) {
-                                targetElement.scrollIntoView({
-                                    behavior: 'smooth'
-                                });
-                            }
-                        }
-                    });
-
-                    // Handle header contact button
-                    const contactBtn = document.querySelector('.contact-btn');
-                    if (contactBtn) {
-                        contactBtn.addEventListener('click', function(e) {
-                            e.preventDefault();
-                            const contactSection = document.getElementById('contact');
-                            if (contactSection) {
-                                contactSection.scrollIntoView({
-                                    behavior: 'smooth'
-                                });
-                            }
-                        });
-                    }
-                });
-            </script>
         </footer>
     </body>
 </html>
@@ -97,26 +70,998 @@ app.index_string = '''
 # Load environment variables from .env file
 load_dotenv()
 
-# server = app.server
-# Helper function to encode images
-def encode_image(image_path):
-    with open(image_path, 'rb') as f:
-        encoded = base64.b64encode(f.read()).decode('ascii')
-    return f'data:image/jpeg;base64,{encoded}'
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+logger = logging.getLogger(__name__)
+
+# Opt-in profiling: PROFILING=1 times section builders, callbacks and
+# serialization, and adds the results to /metrics and Server-Timing headers
+PROFILING = os.environ.get('PROFILING', '').lower() in ('1', 'true', 'yes')
+
+
+class Profiler:
+    """Accumulates timings and payload sizes, process-wide and for the current request."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.timings = {}  # (kind, name) -> [count, total seconds]
+        self.payload_bytes = {}  # section -> size of its serialized JSON
+
+    def record(self, kind, name, seconds):
+        with self._lock:
+            entry = self.timings.setdefault((kind, name), [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+        if flask.has_request_context():
+            flask.g.setdefault('server_timings', []).append((f'{kind}-{name}', seconds))
+
+    def timed(self, kind, name=None):
+        """Decorator recording each call's duration; returns the function untouched when profiling is off."""
+        def decorate(func):
+            if not PROFILING:
+                return func
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(kind, name or func.__name__, time.perf_counter() - started)
+            return wrapper
+        return decorate
+
+
+profiler = Profiler()
+
+# Image folders served through the fingerprinted /images route
+IMAGE_DIRS = {
+    'certificate': os.path.join(BASE_DIR, 'data', 'certificate'),
+    'achievement': os.path.join(BASE_DIR, 'data', 'achive_image'),
+    'certificate-page': os.path.join(BASE_DIR, 'build', 'certificates'),  # PDF first pages, see build.py certificates
+}
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+IMAGE_MAX_AGE = 365 * 24 * 60 * 60  # fingerprinted URLs never change, so cache for a year
+
+# Responsive variants produced by `python build.py images`
+IMAGE_BUILD_DIR = os.path.join(BASE_DIR, 'build', 'images')
+IMAGE_MANIFEST = os.path.join(IMAGE_BUILD_DIR, 'manifest.json')
+IMAGE_WIDTHS = [480, 960, 1600]
+CAROUSEL_IMAGE_WIDTH = 960  # carousels are at most 800px wide
+
+# path -> (mtime, size, digest); avoids re-hashing files that have not changed
+_fingerprints = {}
+
+
+def file_fingerprint(path):
+    """Return a short content hash of the file, cached until its mtime or size changes."""
+    stat = os.stat(path)
+    cached = _fingerprints.get(path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    indexed = load_asset_index().get(os.path.relpath(path, BASE_DIR))
+    if indexed and (indexed['mtime_ns'], indexed['size']) == (stat.st_mtime_ns, stat.st_size):
+        _fingerprints[path] = (stat.st_mtime_ns, stat.st_size, indexed['hash'])
+        return indexed['hash']
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b''):
+            digest.update(chunk)
+    fingerprint = digest.hexdigest()[:16]
+    _fingerprints[path] = (stat.st_mtime_ns, stat.st_size, fingerprint)
+    return fingerprint
+
+
+def list_images(kind, prefix=''):
+    """Sorted image filenames in one of the IMAGE_DIRS folders."""
+    directory = IMAGE_DIRS[kind]
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        file for file in os.listdir(directory)
+        if file.startswith(prefix) and file.lower().endswith(IMAGE_EXTENSIONS)
+    )
+
+
+# Loaded build outputs and the mtime they were read at, so a rebuild is picked up without a restart
+_build_files = {}
+
+
+def load_build_file(path, key):
+    """`key` section of a JSON file written by build.py, or an empty dict if that build has not been run."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return {}
+    cached = _build_files.get(path)
+    if cached is None or cached[0] != mtime:
+        try:
+            with open(path) as f:
+                data = json.load(f)[key]
+        except (OSError, ValueError, KeyError):
+            data = {}
+        cached = _build_files[path] = (mtime, data)
+    return cached[1]
+
+
+def load_image_manifest():
+    """Variant manifest from the image build, or an empty one if the build has not been run."""
+    return load_build_file(IMAGE_MANIFEST, 'images')
+
+
+def image_variants(kind, filename, fingerprint):
+    """Built variants for an image, ignoring a manifest entry that predates the current file."""
+    entry = load_image_manifest().get(f'{kind}/{filename}')
+    if entry and entry['source_hash'] == fingerprint:
+        return entry['variants']
+    return []
 
 
-# Get climate challenge images
-climate_images = []
-data_dir = os.path.join(os.getcwd(), 'data/achive_image')
-for file in os.listdir(data_dir):
-    if file.startswith('climate') and file.endswith(('.jpg', '.jpeg', '.png')):
-        climate_images.append(encode_image(os.path.join(data_dir, file)))
+def pick_variant(variants, width, accept):
+    """Smallest variant at least `width` wide, as WebP when the browser accepts it and JPEG otherwise."""
+    fmt = 'webp' if 'image/webp' in accept else 'jpeg'
+    candidates = [v for v in variants if v['format'] == fmt]
+    if not candidates:
+        return None
+    wide_enough = [v for v in candidates if v['width'] >= width]
+    if wide_enough:
+        return min(wide_enough, key=lambda v: v['width'])
+    return max(candidates, key=lambda v: v['width'])
+
+
+# Precomputed metadata for every image, written by `python build.py index`
+ASSET_INDEX = os.path.join(BASE_DIR, 'build', 'asset-index.json')
+PLACEHOLDER_SIZE = 16  # longest side of the blurred preview stored with each image
+
+
+def load_asset_index():
+    """Asset index keyed by path relative to BASE_DIR; loaded on first use and shared by all sections."""
+    return load_build_file(ASSET_INDEX, 'assets')
+
+
+def parse_title(filename):
+    """Display title and year from a file name.
+
+    E.g. 'sampling_certificate-2023.jpg' -> ('Sampling Certificate', '2023').
+
+    Page-export suffixes ('_page-0001') and copy markers (' (1)') are dropped, and
+    only the first letter of each word is raised, so 'AI6' and 'DataCamp' keep their capitals.
+    """
+    name = os.path.splitext(filename)[0]
+    name = re.sub(r'[-_ ]+page[-_ ]*\d+$', '', name, flags=re.I)
+    name = re.sub(r'\s*\(\d+\)', '', name)
+    m = re.search(r'(.+?)[-_ ]+((?:19|20)\d{2})$', name)
+    if m:
+        raw_title, year = m.group(1), m.group(2)
+    else:
+        raw_title, year = name, ""
+    words = raw_title.replace('_', ' ').replace('-', ' ').split()
+    return ' '.join(w[:1].upper() + w[1:] for w in words), year
+
+
+def describe_asset(kind, filename):
+    """Index entry for one image; build.py adds the pixel dimensions and the blurred preview."""
+    path = os.path.join(IMAGE_DIRS[kind], filename)
+    stat = os.stat(path)
+    title, year = parse_title(filename)
+    return {
+        'path': os.path.relpath(path, BASE_DIR),
+        'kind': kind,
+        'mime': mimetypes.guess_type(filename)[0],
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'width': None,
+        'height': None,
+        'placeholder': None,  # data: URI of a PLACEHOLDER_SIZE WebP thumbnail
+        'hash': file_fingerprint(path),
+        'title': title,
+        'year': year,
+    }
+
+
+def asset_info(kind, filename):
+    """Indexed metadata for an image, falling back to reading the file when the index is missing or stale."""
+    path = os.path.join(IMAGE_DIRS[kind], filename)
+    entry = load_asset_index().get(os.path.relpath(path, BASE_DIR))
+    if entry:
+        stat = os.stat(path)
+        if (entry['mtime_ns'], entry['size']) == (stat.st_mtime_ns, stat.st_size):
+            return entry
+    return describe_asset(kind, filename)
+
+
+def image_placeholder(kind, filename, fit='contain'):
+    """(width, height, style) reserving an image's box before it loads.
+
+    The style sizes the element at the image's aspect ratio and paints the
+    blurred preview behind it, scaled like the image (`fit` is its
+    object-fit), so the page neither shifts nor shows a blank area while the
+    full image streams. (None, None, {}) until `build.py index` has measured the image.
+    """
+    info = asset_info(kind, filename)
+    if not info.get('width'):
+        return None, None, {}
+    style = {'aspectRatio': f"{info['width']} / {info['height']}"}
+    if info.get('placeholder'):
+        style.update(backgroundImage=f"url({info['placeholder']})", backgroundSize=fit,
+                     backgroundPosition='center', backgroundRepeat='no-repeat')
+    return info['width'], info['height'], style
+
+
+# Certificate catalog written by `python build.py certificates`: every file in
+# data/certificate with its content hash and parsed title, and PDFs rendered to
+# an image of their first page
+CERTIFICATE_EXTENSIONS = IMAGE_EXTENSIONS + ('.pdf',)
+CERTIFICATE_CATALOG = os.path.join(BASE_DIR, 'build', 'certificates.json')
+
+
+def load_certificate_catalog():
+    return load_build_file(CERTIFICATE_CATALOG, 'certificates')
+
+
+def list_certificates():
+    """(image kind, image file, title, year) of each certificate to show, in file name order.
+
+    Catalog entries are used while their source file is unchanged. Files added or
+    edited since the last ingest are shown as they are, except PDFs, which have
+    to be rendered first.
+    """
+    directory = IMAGE_DIRS['certificate']
+    if not os.path.isdir(directory):
+        return []
+    catalog = load_certificate_catalog()
+    certificates = []
+    for file in sorted(os.listdir(directory)):
+        if not file.lower().endswith(CERTIFICATE_EXTENSIONS):
+            continue
+        path = os.path.join(directory, file)
+        stat = os.stat(path)
+        entry = catalog.get(os.path.relpath(path, BASE_DIR))
+        if entry and (entry['mtime_ns'], entry['size']) == (stat.st_mtime_ns, stat.st_size):
+            duplicate_of = entry.get('duplicate_of')
+            if not entry.get('image') or (duplicate_of and os.path.exists(os.path.join(BASE_DIR, duplicate_of))):
+                continue
+            if not os.path.isfile(os.path.join(IMAGE_DIRS[entry['image']['kind']], entry['image']['file'])):
+                continue  # render deleted since the last ingest
+            certificates.append((entry['image']['kind'], entry['image']['file'], entry['title'], entry['year']))
+        elif file.lower().endswith(IMAGE_EXTENSIONS):
+            info = asset_info('certificate', file)
+            certificates.append(('certificate', file, info['title'], info['year']))
+    return certificates
+
+
+def image_url(kind, filename, width=None):
+    """Cacheable URL for an image; the fingerprint changes whenever the file content does.
+
+    With `width`, the route serves the closest built variant instead of the original.
+    """
+    fingerprint = file_fingerprint(os.path.join(IMAGE_DIRS[kind], filename))
+    url = f'/images/{kind}/{fingerprint}/{quote(filename)}'
+    if width and image_variants(kind, filename, fingerprint):
+        url += f'?w={width}'
+    return url
+
+
+def image_srcset(kind, filename):
+    """`srcSet` value listing every built width of an image, or None before the image build has run."""
+    fingerprint = file_fingerprint(os.path.join(IMAGE_DIRS[kind], filename))
+    widths = sorted({v['width'] for v in image_variants(kind, filename, fingerprint)})
+    if not widths:
+        return None
+    return ', '.join(f'{image_url(kind, filename, width=w)} {w}w' for w in widths)
+
+
+@server.route('/images/<kind>/<fingerprint>/<path:filename>')
+def serve_image(kind, fingerprint, filename):
+    directory = IMAGE_DIRS.get(kind)
+    path = safe_join(directory, filename) if directory else None
+    if not path or not os.path.isfile(path):
+        flask.abort(404)
+
+    current = file_fingerprint(path)
+    width = flask.request.args.get('w', type=int)
+    if fingerprint != current:
+        # Stale link from an old page render: point the browser at the current version
+        return flask.redirect(image_url(kind, filename, width=width))
+
+    variant = None
+    if width:
+        accept = flask.request.headers.get('Accept', '')
+        variant = pick_variant(image_variants(kind, filename, current), width, accept)
+
+    if variant:
+        response = flask.send_file(os.path.join(IMAGE_BUILD_DIR, variant['file']),
+                                   etag=os.path.splitext(variant['file'])[0] + '-' + variant['format'],
+                                   conditional=True, max_age=IMAGE_MAX_AGE)
+        response.vary.add('Accept')
+    else:
+        response = flask.send_file(path, etag=current, conditional=True, max_age=IMAGE_MAX_AGE)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+
+# Response compression: Brotli when the client accepts it and the module is
+# installed, gzip otherwise. Static assets are compressed ahead of time.
+ASSETS_DIR = os.path.join(BASE_DIR, 'assets')
+COMPRESSED_DIR = os.path.join(BASE_DIR, 'build', 'compressed')
+COMPRESSIBLE_TYPES = {'application/json', 'text/html', 'text/css', 'text/plain', 'text/javascript',
+                      'application/javascript', 'application/pdf', 'image/svg+xml'}
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.pdf', '.svg', '.html', '.json', '.txt')
+COMPRESS_MIN_BYTES = 500
+ENCODING_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+ENCODINGS = ['br', 'gzip'] if brotli else ['gzip']
+
+
+def compress_bytes(data, encoding, best=False):
+    """Compress a whole body; `best` trades speed for size when compressing ahead of time."""
+    if encoding == 'br':
+        return brotli.compress(data, quality=11 if best else 5)
+    return gzip.compress(data, compresslevel=9 if best else 6)
+
+
+def compress_stream(chunks, encoding):
+    """Compress a streamed body chunk by chunk instead of buffering it first."""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=5)
+        for chunk in chunks:
+            yield compressor.process(chunk)
+        yield compressor.finish()
+    else:
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+        for chunk in chunks:
+            yield compressor.compress(chunk)
+        yield compressor.flush()
+
+
+def precompressed_path(source_path, encoding):
+    return os.path.join(COMPRESSED_DIR, file_fingerprint(source_path) + ENCODING_SUFFIXES[encoding])
+
+
+def precompress_assets():
+    """Write .br/.gz copies of the compressible files in assets/, skipping ones already built.
+
+    Returns (relative path, original bytes, {encoding: compressed bytes}) for each file.
+    """
+    os.makedirs(COMPRESSED_DIR, exist_ok=True)
+    report = []
+    for root, _, files in os.walk(ASSETS_DIR):
+        for file in sorted(files):
+            if not file.lower().endswith(COMPRESSIBLE_EXTENSIONS):
+                continue
+            source_path = os.path.join(root, file)
+            sizes = {}
+            for encoding in ENCODINGS:
+                out_path = precompressed_path(source_path, encoding)
+                if not os.path.exists(out_path):
+                    with open(source_path, 'rb') as f:
+                        data = compress_bytes(f.read(), encoding, best=True)
+                    with open(out_path + '.tmp', 'wb') as f:
+                        f.write(data)
+                    os.replace(out_path + '.tmp', out_path)
+                sizes[encoding] = os.path.getsize(out_path)
+            report.append((os.path.relpath(source_path, ASSETS_DIR), os.path.getsize(source_path), sizes))
+    return report
+
+
+@server.before_request
+def serve_precompressed_asset():
+    """Serve /assets files from their precompressed copy when the client accepts one."""
+    request = flask.request
+    if request.method != 'GET' or not request.path.startswith('/assets/') or 'Range' in request.headers:
+        return None
+    source_path = safe_join(ASSETS_DIR, request.path[len('/assets/'):])
+    if not source_path or not os.path.isfile(source_path):
+        return None
+    available = [e for e in ENCODINGS if os.path.exists(precompressed_path(source_path, e))]
+    encoding = request.accept_encodings.best_match(available) if available else None
+    if not encoding:
+        return None
+
+    response = flask.send_file(precompressed_path(source_path, encoding),
+                               mimetype=mimetypes.guess_type(source_path)[0],
+                               etag=f'{file_fingerprint(source_path)}-{encoding}', conditional=True)
+    response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+_component_suites = {}  # (path, encoding) -> compressed body
+_compressed_layouts = {}  # (resume version or None, encoding) -> (digest of the layout, compressed body)
+
+
+@server.after_request
+def compress_response(response):
+    """Compress JSON/HTML/text responses (layout, callbacks, index page) on the fly."""
+    if (response.direct_passthrough or response.status_code in (204, 206, 304) or response.status_code < 200
+            or 'Content-Encoding' in response.headers or response.mimetype not in COMPRESSIBLE_TYPES):
+        return response
+    if flask.request.path.startswith('/_dash-component-suites/') and response.get_etag()[0]:
+        # Dash revalidates non-fingerprinted suites by exact ETag match, which a weakened tag would never hit
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = flask.request.accept_encodings.best_match(ENCODINGS)
+    if not encoding:
+        return response
+
+    if response.is_streamed:
+        response.response = compress_stream(response.response, encoding)
+        response.headers.pop('Content-Length', None)
+    else:
+        data = response.get_data()
+        if len(data) < COMPRESS_MIN_BYTES:
+            return response
+        if flask.request.path.startswith('/_dash-component-suites/') and response.cache_control.max_age:
+            # Dash's fingerprinted React/component scripts never change: compress each once
+            key = (flask.request.path, encoding)
+            if key not in _component_suites:
+                _component_suites[key] = compress_bytes(data, encoding)
+            response.set_data(_component_suites[key])
+        elif flask.request.path.endswith('_dash-layout'):
+            # Every visitor of a page gets the same layout: compress it once per page until it changes.
+            # The digest catches changes outside the cached sections; a section rebuild also clears these.
+            key = (resume_version(request_page_path()), encoding)
+            digest = hashlib.sha1(data).digest()
+            cached = _compressed_layouts.get(key)
+            if cached is None or cached[0] != digest:
+                cached = _compressed_layouts[key] = (digest, compress_bytes(data, encoding))
+            response.set_data(cached[1])
+        else:
+            response.set_data(compress_bytes(data, encoding))
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+
+# Script bundles: the sources of each bundle concatenated (and minified by
+# `build.py bundle`) and served under their content hash with a year-long
+# cache lifetime. Without a build the sources are concatenated on request.
+BUNDLE_BUILD_DIR = os.path.join(BASE_DIR, 'build', 'bundles')
+BUNDLE_MANIFEST = os.path.join(BASE_DIR, 'build', 'bundles.json')
+BUNDLES = {
+    'site.js': [os.path.join(ASSETS_DIR, 'script.js')],
+}
+
+
+def bundle_fingerprint(name):
+    """Content hash over every source of a bundle."""
+    digest = hashlib.sha256(''.join(file_fingerprint(path) for path in BUNDLES[name]).encode())
+    return digest.hexdigest()[:16]
+
+
+def bundle_url(name):
+    return f'/bundles/{bundle_fingerprint(name)}/{name}'
+
+
+def bundle_build(name, fingerprint):
+    """Manifest entry of the built bundle, or None if it is missing or out of date."""
+    entry = load_build_file(BUNDLE_MANIFEST, 'bundles').get(name)
+    if not entry or entry.get('source_hash') != fingerprint:
+        return None
+    return entry
+
+
+def concatenate_sources(name):
+    parts = []
+    for path in BUNDLES[name]:
+        with open(path, 'rb') as f:
+            parts.append(f.read().rstrip() + b'\n')
+    return b''.join(parts)
+
+
+@server.route('/bundles/<fingerprint>/<name>')
+def serve_bundle(fingerprint, name):
+    if name not in BUNDLES:
+        flask.abort(404)
+    current = bundle_fingerprint(name)
+    if fingerprint != current:
+        return flask.redirect(bundle_url(name))
+
+    mimetype = mimetypes.guess_type(name)[0]
+    entry = bundle_build(name, current)
+    if entry:
+        # Built bundles come with .br/.gz siblings compressed at the highest level
+        path = os.path.join(BUNDLE_BUILD_DIR, entry['file'])
+        encoding = flask.request.accept_encodings.best_match(
+            [e for e in ENCODINGS if os.path.exists(path + ENCODING_SUFFIXES[e])])
+        response = flask.send_file(path + ENCODING_SUFFIXES[encoding] if encoding else path, mimetype=mimetype,
+                                   etag=f'{current}-{encoding or "identity"}', conditional=True,
+                                   max_age=IMAGE_MAX_AGE)
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+    else:
+        # compress_response compresses this one on the fly
+        response = flask.Response(concatenate_sources(name), mimetype=mimetype)
+        response.set_etag(current)
+        response.cache_control.max_age = IMAGE_MAX_AGE
+        response = response.make_conditional(flask.request)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+
+# Loaded after the Dash renderer's dependencies; deferred so it never blocks parsing
+app.config.external_scripts.append({'src': bundle_url('site.js'), 'defer': 'defer'})
+
+
+# Third-party stylesheets and fonts. `build.py vendor` downloads them, subsets
+# Font Awesome to the icons and Poppins to the weights the site uses, and points
+# their font URLs at /vendor/fonts/. Vendored stylesheets join custom.css in the
+# site.css bundle, so the page needs no other origin; ones not vendored yet load
+# from their CDN.
+VENDOR_DIR = os.path.join(BASE_DIR, 'build', 'vendor')
+VENDOR_MANIFEST = os.path.join(BASE_DIR, 'build', 'vendor.json')
+VENDOR_STYLESHEETS = {  # vendored file -> CDN URL it is built from
+    'bootstrap.css': dbc.themes.FLATLY,
+    'fontawesome.css': 'https://use.fontawesome.com/releases/v5.15.4/css/all.css',
+    'poppins.css': 'https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600;700&display=swap',
+}
+VENDOR_SCRIPTS = {  # only the static export needs Bootstrap's JavaScript; Dash renders the components itself
+    'bootstrap.bundle.js': 'https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js',
+}
+PRELOAD_FONTS = ['poppins-400', 'poppins-700', 'fa-brands-400']  # used above the fold
+
+BUNDLES['site.css'] = [os.path.join(VENDOR_DIR, name) for name in VENDOR_STYLESHEETS
+                       if os.path.isfile(os.path.join(VENDOR_DIR, name))] + [os.path.join(ASSETS_DIR, 'custom.css')]
+app.config.external_stylesheets.extend(
+    [url for name, url in VENDOR_STYLESHEETS.items() if not os.path.isfile(os.path.join(VENDOR_DIR, name))]
+    + [bundle_url('site.css')])
+
+
+@server.route('/vendor/fonts/<name>')
+def serve_vendor_font(name):
+    # Font files are named by content hash
+    response = flask.send_from_directory(os.path.join(VENDOR_DIR, 'fonts'), name, max_age=IMAGE_MAX_AGE)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+
+# Documents: every version of the resume PDF, served with byte ranges so the
+# browser's PDF viewer can show the first page before the rest has arrived.
+DOCUMENT_BUILD_DIR = os.path.join(BASE_DIR, 'build', 'documents')
+DOCUMENT_MANIFEST = os.path.join(BASE_DIR, 'build', 'documents.json')
+DOCUMENT_PREVIEW_WIDTH = 480
+RESUME_VERSIONS = {  # URL slug -> (label, path); the first one is shown at /resume
+    'latest': ('Latest', os.path.join(ASSETS_DIR, 'resume.pdf')),
+    '2025': ('2025', os.path.join(BASE_DIR, 'resume_2025.pdf')),
+}
+DEFAULT_RESUME = next(iter(RESUME_VERSIONS))
+
+
+def resume_url(version):
+    """Fingerprinted URL of one resume version, safe to cache forever."""
+    return f'/documents/resume/{version}/{file_fingerprint(RESUME_VERSIONS[version][1])}.pdf'
+
+
+def resume_previews(version, fingerprint=None):
+    """First-page preview variants from `build.py documents`, or [] if they are missing or stale."""
+    fingerprint = fingerprint or file_fingerprint(RESUME_VERSIONS[version][1])
+    entry = load_build_file(DOCUMENT_MANIFEST, 'documents').get(f'resume/{version}')
+    if not entry or entry.get('source_hash') != fingerprint:
+        return []
+    return entry['variants']
+
+
+def resume_preview_url(version):
+    """URL of the first-page preview, or None when it has not been built."""
+    fingerprint = file_fingerprint(RESUME_VERSIONS[version][1])
+    if not resume_previews(version, fingerprint):
+        return None
+    return f'/documents/resume/{version}/{fingerprint}/preview'
+
+
+@server.route('/documents/resume/<version>/<fingerprint>.pdf')
+def serve_resume(version, fingerprint):
+    if version not in RESUME_VERSIONS or not os.path.isfile(RESUME_VERSIONS[version][1]):
+        flask.abort(404)
+    path = RESUME_VERSIONS[version][1]
+    current = file_fingerprint(path)
+    if fingerprint != current:
+        return flask.redirect(resume_url(version))
+
+    # conditional=True answers Range with 206 and If-None-Match/If-Modified-Since with 304;
+    # the body goes out through wsgi.file_wrapper, i.e. sendfile under gunicorn.
+    response = flask.send_file(path, mimetype='application/pdf', download_name=f'resume-{version}.pdf',
+                               etag=current, conditional=True, max_age=IMAGE_MAX_AGE)
+    # Werkzeug only advertises ranges on 206s; PDF viewers look for it on the first 200
+    response.headers['Accept-Ranges'] = 'bytes'
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+
+@server.route('/documents/resume/<version>/<fingerprint>/preview')
+def serve_resume_preview(version, fingerprint):
+    if version not in RESUME_VERSIONS or not os.path.isfile(RESUME_VERSIONS[version][1]):
+        flask.abort(404)
+    if fingerprint != file_fingerprint(RESUME_VERSIONS[version][1]):
+        return flask.redirect(resume_preview_url(version) or resume_url(version))
+    variant = pick_variant(resume_previews(version, fingerprint), DOCUMENT_PREVIEW_WIDTH,
+                           flask.request.headers.get('Accept', ''))
+    if not variant:
+        flask.abort(404)
+    response = flask.send_file(os.path.join(DOCUMENT_BUILD_DIR, variant['file']),
+                               etag=os.path.splitext(variant['file'])[0] + '-' + variant['format'],
+                               conditional=True, max_age=IMAGE_MAX_AGE)
+    response.vary.add('Accept')
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+
+# Resource hints: what each page needs first (the stylesheet bundle, the fonts
+# above the fold, Dash's scripts and its first two requests, and the page's lead
+# image), sent as a Link header on the page and repeated as <link> tags in its
+# head. Dash only requests the layout once its scripts have run, so preloading
+# it takes a whole round trip off the waterfall.
+#
+# With EARLY_HINTS=1 the same header also goes out as a 103 Early Hints response
+# before the page is rendered, on servers that expose the client socket
+# (gunicorn, Werkzeug). Only enable it behind a proxy or CDN that relays 103s:
+# browsers honour them over HTTP/2 and later, and some HTTP/1.1 clients mistake
+# a 103 for the final response.
+EARLY_HINTS = os.environ.get('EARLY_HINTS', '0') == '1'
+
+_index_scripts = []  # script URLs of the index page, read from its first render
+
+
+def resource_hints(path):
+    """(url, attributes) of the resources the page at `path` needs first; the attributes include rel."""
+    origins = list(dict.fromkeys(
+        '{0.scheme}://{0.netloc}'.format(urlsplit(url)) for url in app.config.external_stylesheets
+        if isinstance(url, str) and url.startswith('https://')))
+    hints = [(origin, {'rel': 'preconnect'}) for origin in origins]
+    if 'https://fonts.googleapis.com' in origins:
+        hints.append(('https://fonts.gstatic.com', {'rel': 'preconnect', 'crossorigin': True}))
+
+    hints.append((bundle_url('site.css'), {'rel': 'preload', 'as': 'style'}))
+    fonts = load_build_file(VENDOR_MANIFEST, 'fonts')
+    hints += [(f'/vendor/fonts/{fonts[name]}', {'rel': 'preload', 'as': 'font', 'type': 'font/woff2',
+                                                'crossorigin': True})
+              for name in PRELOAD_FONTS if name in fonts]
+
+    version = resume_version(path)
+    if version is None:
+        profile_image = get_profile_image()
+        if profile_image:
+            hints.append((profile_image['src'], {'rel': 'preload', 'as': 'image',
+                                                 'imagesrcset': profile_image['srcSet'], 'imagesizes': '220px'}))
+    elif resume_preview_url(version):
+        hints.append((resume_preview_url(version), {'rel': 'preload', 'as': 'image'}))
+
+    hints += [(url, {'rel': 'preload', 'as': 'script'}) for url in _index_scripts]
+    hints += [(url, {'rel': 'preload', 'as': 'fetch', 'crossorigin': True})
+              for url in ('/_dash-dependencies', '/_dash-layout')]
+    return hints
+
+
+def link_header(hints):
+    """Link header value for resource hints."""
+    def param(key, value):
+        if value is True:
+            return key
+        return f'{key}={value}' if re.fullmatch(r'[\w.-]+', value) else f'{key}="{value}"'
+    return ', '.join(f'<{url}>; ' + '; '.join(param(key, value) for key, value in attrs.items() if value)
+                     for url, attrs in hints)
+
+
+def link_tags(hints):
+    """<link> tags for resource hints, matching link_header()."""
+    def attr(key, value):
+        return key if value is True else f'{key}="{value}"'
+    return '\n        '.join('<link ' + ' '.join(attr(key, value) for key, value in dict(attrs, href=url).items()) + '>'
+                              for url, attrs in hints)
+
+
+def is_page(path):
+    """Whether `path` is one of the site's pages, as opposed to an asset or API route."""
+    return path == '/' or resume_version(path) is not None
+
+
+_interpolate_index = app.interpolate_index
+
+
+def interpolate_index(**kwargs):
+    if not _index_scripts:
+        _index_scripts.extend(re.findall(r'<script src="(/[^"]+)"', kwargs['scripts']))
+    path = flask.request.path if flask.has_request_context() else '/'
+    kwargs['css'] = link_tags(resource_hints(path)) + '\n        ' + kwargs['css']
+    return _interpolate_index(**kwargs)
+
+
+app.interpolate_index = interpolate_index
+
+
+@server.after_request
+def add_resource_hints(response):
+    if (flask.request.method == 'GET' and response.status_code == 200 and response.mimetype == 'text/html'
+            and is_page(flask.request.path)):
+        response.headers['Link'] = link_header(resource_hints(flask.request.path))
+    return response
+
+
+class EarlyHints:
+    """WSGI middleware that writes a 103 Early Hints response ahead of each page."""
+
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+
+    def __call__(self, environ, start_response):
+        sock = environ.get('gunicorn.socket') or environ.get('werkzeug.socket')
+        if (sock is not None and environ['REQUEST_METHOD'] == 'GET'
+                and environ.get('SERVER_PROTOCOL') == 'HTTP/1.1'
+                and 'text/html' in environ.get('HTTP_ACCEPT', '') and is_page(environ.get('PATH_INFO', ''))):
+            try:
+                header = link_header(resource_hints(environ['PATH_INFO']))
+                sock.sendall(b'HTTP/1.1 103 Early Hints\r\nLink: ' + header.encode('latin-1') + b'\r\n\r\n')
+            except (OSError, UnicodeEncodeError):
+                pass  # the final response still carries the Link header
+        return self.wsgi_app(environ, start_response)
+
+
+if EARLY_HINTS:
+    server.wsgi_app = EarlyHints(server.wsgi_app)
+
+
+# Service worker: precaches the page shell, the fingerprinted bundles, fonts and
+# Dash scripts, and the resume; serves immutable URLs cache-first and the Dash
+# layout and dependencies stale-while-revalidate. Its cache names carry a
+# version hashed from the precache list and the build manifests, so a deploy
+# replaces them.
+SERVICE_WORKER_MANIFESTS = [IMAGE_MANIFEST, ASSET_INDEX, DOCUMENT_MANIFEST, CERTIFICATE_CATALOG, BUNDLE_MANIFEST,
+                            VENDOR_MANIFEST]
+
+SERVICE_WORKER = """
+const VERSION = %(version)s;
+const PRECACHE = %(precache)s;
+const PAGES = %(pages)s;
+const SHELL_CACHE = 'portfolio-shell-' + VERSION;
+const RUNTIME_CACHE = 'portfolio-runtime-' + VERSION;
+const IMMUTABLE = /^\\/(images|bundles|vendor|documents|_dash-component-suites)\\//;
+
+// The layout starts on the page it was requested from, so it is kept once per page
+function layoutKey(page) {
+    return '/_dash-layout?page=' + encodeURIComponent(page);
+}
+
+function precacheLayout(cache, page) {
+    return fetch('/_dash-layout', {referrer: page}).then(function(response) {
+        if (!response.ok) {
+            throw new Error('Layout of ' + page + ' failed with ' + response.status);
+        }
+        return cache.put(layoutKey(page), response);
+    });
+}
+
+self.addEventListener('install', function(event) {
+    event.waitUntil(caches.open(SHELL_CACHE)
+        .then(function(cache) {
+            return Promise.all([cache.addAll(PRECACHE)].concat(PAGES.map(function(page) {
+                return precacheLayout(cache, page);
+            })));
+        })
+        .then(function() { return self.skipWaiting(); }));
+});
+
+self.addEventListener('activate', function(event) {
+    event.waitUntil(caches.keys()
+        .then(function(keys) {
+            return Promise.all(keys.filter(function(key) {
+                return key !== SHELL_CACHE && key !== RUNTIME_CACHE;
+            }).map(function(key) { return caches.delete(key); }));
+        })
+        .then(function() { return self.clients.claim(); }));
+});
+
+function store(cacheName, key, response) {
+    if (response.status === 200 && response.type === 'basic') {
+        var copy = response.clone();
+        caches.open(cacheName).then(function(cache) { cache.put(key, copy); });
+    }
+    return response;
+}
+
+function cacheFirst(request) {
+    return caches.match(request).then(function(hit) {
+        return hit || fetch(request).then(function(response) { return store(RUNTIME_CACHE, request, response); });
+    });
+}
+
+function staleWhileRevalidate(event, key) {
+    var network = fetch(event.request).then(function(response) { return store(SHELL_CACHE, key, response); });
+    event.waitUntil(network.catch(function() {}));
+    return caches.match(key).then(function(hit) { return hit || network; });
+}
+
+self.addEventListener('fetch', function(event) {
+    var request = event.request;
+    var url = new URL(request.url);
+    // Range requests (the PDF viewer) and everything cross-origin or non-GET go straight to the network
+    if (request.method !== 'GET' || url.origin !== self.location.origin || request.headers.has('range')) {
+        return;
+    }
+    if (IMMUTABLE.test(url.pathname)) {
+        event.respondWith(cacheFirst(request));
+    } else if (url.pathname === '/_dash-layout') {
+        var page = request.referrer ? new URL(request.referrer).pathname : '/';
+        event.respondWith(staleWhileRevalidate(event, layoutKey(page)));
+    } else if (url.pathname === '/_dash-dependencies') {
+        event.respondWith(staleWhileRevalidate(event, url.pathname));
+    } else if (request.mode === 'navigate' && PAGES.indexOf(url.pathname) !== -1) {
+        // Only the site's pages: /metrics, /ready and the like always come from the server
+        event.respondWith(staleWhileRevalidate(event, url.pathname));
+    }
+});
+"""
+
+
+def service_worker_pages():
+    """Paths of the site's pages: the portfolio and each resume version that exists."""
+    return ['/', '/resume'] + [f'/resume/{version}' for version, (_, path) in RESUME_VERSIONS.items()
+                               if os.path.isfile(path)]
+
+
+def service_worker_precache():
+    """Every page and the same-origin URLs it loads, plus the layout's dependencies and the default resume.
+
+    Layouts are left out: the worker fetches one per page itself, see precacheLayout.
+    """
+    urls = []
+    for page in service_worker_pages():
+        with server.test_request_context(page):
+            index = app.index()
+        urls += [page] + [url for url in re.findall(r'(?:src|href)="(/[^"]*)"', index) if not url.startswith('//')]
+    urls = [url for url in urls if url != '/_dash-layout']
+    urls += ['/_dash-dependencies', resume_url(DEFAULT_RESUME)]
+    return list(dict.fromkeys(urls))
+
+
+# path signature of what the script is built from -> (script, ETag); holds the current version only
+_service_worker = {}
+
+
+@server.route('/sw.js')
+def serve_service_worker():
+    # Rendering the precache list renders every page, so only redo it when a manifest, resume or asset changes
+    signature = path_signature(SERVICE_WORKER_MANIFESTS + [path for _, path in RESUME_VERSIONS.values()]
+                               + [ASSETS_DIR])
+    cached = _service_worker.get(signature)
+    if cached is None:
+        precache, pages = service_worker_precache(), service_worker_pages()
+        digest = hashlib.sha256(json.dumps([precache, pages]).encode())
+        for path in SERVICE_WORKER_MANIFESTS:
+            if os.path.isfile(path):
+                digest.update(file_fingerprint(path).encode())
+        script = SERVICE_WORKER % {'version': json.dumps(digest.hexdigest()[:16]), 'precache': json.dumps(precache),
+                                   'pages': json.dumps(pages)}
+        cached = (script, hashlib.sha1(script.encode()).hexdigest())
+        _service_worker.clear()
+        _service_worker[signature] = cached
+    script, etag = cached
+    response = flask.Response(script, mimetype='application/javascript')
+    # Browsers revalidate the worker on navigation; answer unchanged ones with a 304
+    response.cache_control.no_cache = True
+    response.set_etag(etag)
+    return response.make_conditional(flask.request)
+
+
+def get_climate_images():
+    """(URL, placeholder style) of each climate challenge photo for the carousel."""
+    return [
+        (image_url('achievement', file, width=CAROUSEL_IMAGE_WIDTH), image_placeholder('achievement', file)[2])
+        for file in list_images('achievement', prefix='climate')
+    ]
+
+
+def get_profile_image():
+    """html.Img props for the profile picture (climate13.jpg), or None if it is missing."""
+    if not os.path.exists(os.path.join(IMAGE_DIRS['achievement'], 'climate13.jpg')):
+        return None
+    width, height, style = image_placeholder('achievement', 'climate13.jpg', fit='cover')
+    return {
+        'src': image_url('achievement', 'climate13.jpg', width=IMAGE_WIDTHS[0]),
+        'srcSet': image_srcset('achievement', 'climate13.jpg'),
+        'width': width,
+        'height': height,
+        'style': style,
+    }
+
+
+# Portfolio content lives in data/content/*.json so it can be edited without a
+# redeploy; the layout cache rebuilds a section when its file changes.
+CONTENT_DIR = os.path.join(BASE_DIR, 'data', 'content')
+
+
+@dataclass(frozen=True, slots=True)
+class Project:
+    title: str
+    description: str
+    tech: tuple
+    link: str
+    icon: str
+
+
+@dataclass(frozen=True, slots=True)
+class Achievement:
+    title: str
+    description: str
+
+
+@dataclass(frozen=True, slots=True)
+class Skills:
+    technical: tuple
+    domain: tuple
+
+
+# path -> (mtime, parsed models)
+_content = {}
+
+
+def content_path(name):
+    return os.path.join(CONTENT_DIR, f'{name}.json')
+
+
+def load_content(name, parse):
+    """Parsed models for a content file, re-read only when the file changes.
+
+    A file that is missing or fails to parse (e.g. mid-edit or mid-rename) keeps
+    serving the last good version.
+    """
+    path = content_path(name)
+    cached = _content.get(path)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with open(path, encoding='utf-8') as f:
+            models = parse(json.load(f))
+    except (OSError, ValueError, TypeError, KeyError):
+        if cached is None:
+            raise
+        logger.exception("Could not reload %s; keeping the previous content", path)
+        return cached[1]
+    cached = _content[path] = (mtime, models)
+    return cached[1]
+
+
+def load_projects():
+    return load_content('projects', lambda data: tuple(
+        Project(**dict(project, tech=tuple(project['tech']))) for project in data))
+
+
+def load_achievements():
+    return load_content('achievements', lambda data: tuple(Achievement(**achievement) for achievement in data))
+
+
+def load_skills():
+    return load_content('skills', lambda data: Skills(technical=tuple(data['technical']),
+                                                      domain=tuple(data['domain'])))
+
+
+# Transparent 1x1 GIF shown in carousel slides whose image has not been requested yet
+LAZY_PLACEHOLDER = 'data:image/gif;base64,R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7'
+
+
+def lazy_carousel(name, items, **kwargs):
+    """dbc.Carousel that only loads the first slide and its neighbours up front.
+
+    The real image URLs are kept in a dcc.Store and a clientside callback swaps
+    them in around the active slide as the carousel advances. Slide order and
+    captions are unchanged.
+    """
+    eager = {0, 1, len(items) - 1}
+    return html.Div([
+        dcc.Store(id={'type': 'lazy-carousel-sources', 'index': name}, data=[item['src'] for item in items]),
+        dbc.Carousel(
+            id={'type': 'lazy-carousel', 'index': name},
+            items=[dict(item, src=item['src'] if i in eager else LAZY_PLACEHOLDER) for i, item in enumerate(items)],
+            **kwargs
+        ),
+    ])
 
-# Get profile image (using climate13.jpg)
-profile_image = None
-profile_image_path = os.path.join(data_dir, 'climate13.jpg')
-if os.path.exists(profile_image_path):
-    profile_image = encode_image(profile_image_path)
 
 # Define the navbar (moved outside of create_navigation function)
 # Update the navbar definition
@@ -186,8 +1131,10 @@ def create_header():
 
 def create_about():
     # Use climate13.jpg as profile picture or fallback to icon if not available
+    profile_image = get_profile_image()
     if profile_image:
-        profile_display = html.Img(src=profile_image, className="profile-image", alt="Seye Daniel Oyelayo")
+        profile_display = html.Img(**profile_image, sizes="220px", className="profile-image",
+                                   alt="Seye Daniel Oyelayo")
     else:
         profile_display = html.I(className="fas fa-user-circle fa-8x", style={"color": "#1a73e8"})
 
@@ -218,51 +1165,7 @@ def create_about():
 
 
 def create_projects():
-    projects = [
-        {
-            "title": "FeedEyes",
-            "description": "A least-cost feed formulator that helps farmers optimize animal nutrition while minimizing costs. The application provides optimal feed formulations based on available ingredients and nutritional requirements.",
-            "tech": ["Python", "Linear Programming", "Machine Learning"],
-            "link": "https://feedeyes.onrender.com/",
-            "icon": "fas fa-balance-scale"  # Feed formulation icon
-        },
-        {
-            "title": "Crop Recommendation System",
-            "description": "An intelligent system that recommends suitable crops based on soil characteristics and environmental conditions, helping farmers make informed decisions for optimal yield.",
-            "tech": ["Python", "Machine Learning", "Streamlit"],
-            "link": "https://exwhybaba-crop-recommendation-system-crop-kl5qlo.streamlit.app/",
-            "icon": "fas fa-seedling"  # Plant/crop icon
-        },
-        {
-            "title": "Crop Monitoring System",
-            "description": "A comprehensive system for monitoring crop health and growth using computer vision to identify plant diseases, pests, and nutritional deficiencies.",
-            "tech": ["Computer Vision", "Data Analytics", "Streamlit"],
-            "link": "https://beanclassifer.streamlit.app/",
-            "icon": "fas fa-eye"  # Monitoring/vision icon
-        },
-        {
-            "title": "Customer Churn Prediction",
-            "description": "Machine learning models to predict and prevent customer churn for service providers, enabling proactive retention strategies.",
-            "tech": ["Machine Learning", "Predictive Analytics", "SKLearn"],
-            "link": "https://customerchurn1.streamlit.app/",
-            "icon": "fas fa-users"  # Customer/user icon
-        },
-        {
-            "title": "Malaria Parasite Detector",
-            "description": "An AI system for detecting malaria parasites in blood samples to assist in diagnosis, improving accuracy and speed of detection in healthcare settings.",
-            "tech": ["Deep Learning", "Computer Vision", "Healthcare AI"],
-            "link": "https://youtu.be/cawBUQm6FZk",
-            "icon": "fas fa-microscope"  # Medical/scientific icon
-        },
-        {
-            "title": "Bank Customer Transaction Dashboard",
-            "description": "Interactive analytics dashboard for visualizing customer demographics, account details, and transaction patterns to drive insights on banking behavior and support decision‑making.",
-            "tech": ["Python", "Pandas", "Dash","Docker", "Plotly"],
-            "link": "https://bank-viz.onrender.com/",
-            "icon": "fas fa-university"
-        }
-
-    ]
+    projects = load_projects()
 
     project_cards = [
         dbc.Col([
@@ -270,15 +1173,15 @@ def create_projects():
                 dbc.CardBody([
                     html.Div([
                         html.Div([
-                            html.I(className=project["icon"] + " fa-2x project-icon")
+                            html.I(className=project.icon + " fa-2x project-icon")
                         ], className="project-icon-wrapper"),
-                        html.H4(project["title"], className="card-title mt-3")
+                        html.H4(project.title, className="card-title mt-3")
                     ], className="d-flex flex-column align-items-center"),
                     html.Hr(),
-                    html.P(project["description"], className="card-text"),
+                    html.P(project.description, className="card-text"),
                     html.Div([
                         dbc.Badge(tech, color="info", className="me-1 tech-badge")
-                        for tech in project["tech"]
+                        for tech in project.tech
                     ], className="tech-stack mb-3"),
                     html.Div(
                         html.A(
@@ -286,11 +1189,11 @@ def create_projects():
                                 "View Project ",
                                 html.I(className="fas fa-external-link-alt ms-1")
                             ], color="primary", size="sm", className="mt-2 project-button"),
-                            href=project["link"],
+                            href=project.link,
                             target="_blank"
                         ),
                         className="text-center"
-                    ) if project["link"] != "#" else html.Span()
+                    ) if project.link != "#" else html.Span()
                 ])
             ], className="project-card h-100 shadow-sm")
         ], md=6, lg=4, className="mb-4")
@@ -308,37 +1211,25 @@ def create_projects():
 
 
 def create_achievements():
-    achievements = [
-        {
-            "title": "2023 Cohere Multilingual Hackathon Winner",
-            "description": "Recognized at the prestigious Cohere Multilingual Hackathon for developing innovative NLP solutions that addressed real‑world language processing challenges."
-        },
-        {
-            "title": "Climate Risk Challenge Winner",
-            "description": "Secured a $50,000 Amazon cloud credit for the University of Ibadan and a $1,500 cash prize for our team in the Climate Risk Challenge under the Sustainable Africa Initiative."
-        },
-        {
-            "title": "Legacy AgriTech Hackathon Finalist",
-            "description": "Qualified for the Legacy AgriTech Hackathon, organized by the Mandela Washington Fellowship Alumni Association of Nigeria (MWFAAN), with an innovative agricultural solution."
-        }
-    ]
+    achievements = load_achievements()
 
     achievement_cards = [
         dbc.Col([
             dbc.Card([
                 dbc.CardBody([
-                    html.H4(achievement["title"], className="card-title"),
-                    html.P(achievement["description"], className="card-text"),
+                    html.H4(achievement.title, className="card-title"),
+                    html.P(achievement.description, className="card-text"),
                 ])
             ], className="achievement-card h-100 shadow-sm border-left-accent")
         ], md=6, lg=4, className="mb-4")
         for achievement in achievements
     ]
 
-    climate_image_carousel = dbc.Carousel(
+    climate_image_carousel = lazy_carousel(
+        'climate',
         items=[
-            {"src": img, "caption": f"Climate Challenge Award Ceremony (Image {i + 1})"}
-            for i, img in enumerate(climate_images)
+            {"src": img, "img_style": style, "caption": f"Climate Challenge Award Ceremony (Image {i + 1})"}
+            for i, (img, style) in enumerate(get_climate_images())
         ],
         controls=True,
         indicators=True,
@@ -360,16 +1251,7 @@ def create_achievements():
 
 
 def create_skills():
-    technical_skills = ["Python", "Machine Learning", "Deep Learning", "Computer Vision",
-                        "Data Analysis", "Statistical Modeling", "SQL", "TensorFlow",
-                        "PyTorch", "Scikit-learn", "Pandas", "Github Action", "Docker", "Mlflow",
-                        "Github Actio", "Agriculture Tech", 'Agentic AI', 'RAG',
-                        "Data Visualization", "Natural Language Processing"]
-
-    domain_skills = ["Agricultural Systems", "Livestock Nutrition", "Crop Management",
-                     "Precision Agriculture", "Sustainable Farming", "Food Security",
-                     "Business Intelligence",
-                     "Research Methods"]
+    skills = load_skills()
 
     return dbc.Container([
         html.Div(id="skills"),
@@ -381,14 +1263,14 @@ def create_skills():
                 html.H4("Technical Skills", className="skill-subtitle"),
                 html.Div([
                     dbc.Badge(skill, color="success", className="me-1 mb-2 py-2 px-3 skill-badge")
-                    for skill in technical_skills
+                    for skill in skills.technical
                 ], className="skill-badges")
             ], md=6, className="mb-4"),
             dbc.Col([
                 html.H4("Domain Knowledge", className="skill-subtitle"),
                 html.Div([
                     dbc.Badge(skill, color="primary", className="me-1 mb-2 py-2 px-3 skill-badge")
-                    for skill in domain_skills
+                    for skill in skills.domain
                 ], className="skill-badges")
             ], md=6, className="mb-4")
         ])
@@ -397,34 +1279,15 @@ def create_skills():
 
 
 
-# Helper function to encode images, detecting MIME type from extension
-def encode_image(image_path):
-    ext = os.path.splitext(image_path)[1].lower()
-    mime = 'image/jpeg' if ext in ('.jpg', '.jpeg') else 'image/png'
-    with open(image_path, 'rb') as f:
-        encoded = base64.b64encode(f.read()).decode('ascii')
-    return f'data:{mime};base64,{encoded}'
-
 def create_certificates():
-    data_dir = os.path.join(os.getcwd(), 'data/certificate')
     certificates = []
-    if os.path.isdir(data_dir):
-        for file in sorted(os.listdir(data_dir)):
-            if file.lower().endswith(('.jpg', '.jpeg', '.png')):
-                file_path = os.path.join(data_dir, file)
-                image_data = encode_image(file_path)
-                name = os.path.splitext(file)[0]
-                m = re.search(r'(.+?)[-_ ]+(\d{4})$', name)
-                if m:
-                    raw_title, year = m.group(1), m.group(2)
-                else:
-                    raw_title, year = name, ""
-                title = raw_title.replace('_', ' ').replace('-', ' ').strip().title()
-                certificates.append({
-                    "title": title,
-                    "image_url": image_data,
-                    "date": year
-                })
+    for kind, file, title, year in list_certificates():
+        certificates.append({
+            "title": title,
+            "image_url": image_url(kind, file, width=CAROUSEL_IMAGE_WIDTH),
+            "image_style": image_placeholder(kind, file)[2],
+            "date": year
+        })
     # If no certificates
     if not certificates:
         return dbc.Container([
@@ -441,11 +1304,13 @@ def create_certificates():
             caption += f" ({cert['date']})"
         items.append({
             "src": cert["image_url"],
+            "img_style": cert["image_style"],
             "caption": caption,
             # Optionally: you can include "header" or custom caption styling if desired
         })
 
-    certificate_carousel = dbc.Carousel(
+    certificate_carousel = lazy_carousel(
+        'certificate',
         items=items,
         controls=True,        # show prev/next arrows
         indicators=True,      # show dots
@@ -573,127 +1438,437 @@ def create_main_content():
 
 
 # Create the resume page content
-def create_resume_page():
+def create_resume_versions():
+    """Links to each resume version, with its first-page preview when one has been built."""
+    links = []
+    for version, (label, path) in RESUME_VERSIONS.items():
+        if not os.path.isfile(path):
+            continue
+        preview = resume_preview_url(version)
+        links.append(dbc.NavItem(dbc.NavLink(
+            [html.Img(src=preview, alt="", className="resume-preview d-block mb-1") if preview else None, label],
+            href='/resume' if version == DEFAULT_RESUME else f'/resume/{version}',
+            active='exact',
+        )))
+    return dbc.Nav(links, pills=True, className="resume-versions my-3") if len(links) > 1 else None
+
+
+def create_resume_page(version=DEFAULT_RESUME):
+    """Resume page showing `version`; with None the PDF is left unloaded until the router picks one."""
     return html.Div([
         dbc.Container([
             html.A("← Back to Portfolio", href="/", className="back-link mt-4 d-inline-block"),
-            html.Iframe(src="/assets/resume.pdf", className="resume-frame shadow-sm")
+            create_resume_versions(),
+            html.Iframe(id='resume-frame', src=resume_url(version) if version else None,
+                        className="resume-frame shadow-sm")
         ], className="resume-container my-4")
     ])
 
 
-# Layout with navbar included in the initial layout
-app.layout = html.Div([
-    dcc.Location(id='url', refresh=False),
-    navbar,  # Navbar is now part of the initial layout
-    html.Div(id='page-content')
-])
+LAYOUT_CHECK_INTERVAL = 2.0  # seconds between file-change checks of a cached section
 
 
-# Navbar toggle callback
-@app.callback(
+def path_signature(paths):
+    """Snapshot of name/mtime/size for files and directory contents, used to detect changes."""
+    signature = []
+    for path in paths:
+        if os.path.isdir(path):
+            entries = sorted(os.scandir(path), key=lambda entry: entry.name)
+            signature.append((path, tuple((e.name, e.stat().st_mtime_ns, e.stat().st_size) for e in entries)))
+        elif os.path.exists(path):
+            stat = os.stat(path)
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        else:
+            signature.append((path, None))
+    return tuple(signature)
+
+
+class LayoutCache:
+    """Builds each page section once and keeps its serialized component JSON.
+
+    A section is rebuilt only when one of the files or folders it was registered
+    with changes; those are re-checked at most every `check_interval` seconds.
+    """
+
+    def __init__(self, check_interval=LAYOUT_CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self.hits = 0
+        self.misses = 0
+        self._sections = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, builder, paths=()):
+        self._sections[name] = {'builder': profiler.timed('section', name)(builder), 'paths': tuple(paths),
+                                'json': None, 'signature': None, 'checked': 0.0}
+
+    def get(self, name):
+        section = self._sections[name]
+        now = time.monotonic()
+        if section['json'] is not None and now - section['checked'] < self.check_interval:
+            self.hits += 1
+            return section['json']
+
+        with self._lock:
+            signature = path_signature(section['paths'])
+            section['checked'] = now
+            if section['json'] is not None and signature == section['signature']:
+                self.hits += 1
+                return section['json']
+            self.misses += 1
+            try:
+                component = section['builder']()
+                started = time.perf_counter()
+                payload = to_json_plotly(component)
+            except Exception:
+                if section['json'] is None:
+                    raise
+                logger.exception("Could not rebuild the %s section; keeping the previous layout", name)
+                return section['json']
+            _compressed_layouts.clear()
+            section['json'] = json.loads(payload)
+            section['signature'] = signature
+            if PROFILING:
+                profiler.record('serialize', name, time.perf_counter() - started)
+                profiler.payload_bytes[name] = len(payload)
+            return section['json']
+
+    def clear(self):
+        with self._lock:
+            for section in self._sections.values():
+                section['json'] = section['signature'] = None
+            _compressed_layouts.clear()
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'sections': list(self._sections)}
+
+
+layout_cache = LayoutCache()
+layout_cache.register('header', create_header)
+layout_cache.register('about', create_about, [IMAGE_DIRS['achievement'], IMAGE_MANIFEST, ASSET_INDEX])
+layout_cache.register('projects', create_projects, [content_path('projects')])
+layout_cache.register('achievements', create_achievements,
+                      [content_path('achievements'), IMAGE_DIRS['achievement'], IMAGE_MANIFEST, ASSET_INDEX])
+layout_cache.register('certificates', create_certificates,
+                      [IMAGE_DIRS['certificate'], IMAGE_MANIFEST, ASSET_INDEX, CERTIFICATE_CATALOG])
+layout_cache.register('skills', create_skills, [content_path('skills')])
+layout_cache.register('contact', create_contact)
+layout_cache.register('footer', create_footer)
+
+HOME_SECTIONS = ['header', 'about', 'projects', 'achievements', 'certificates', 'skills', 'contact', 'footer']
+
+
+def preload_shared_state():
+    """Fill the process-wide caches before gunicorn forks its workers.
+
+    Workers then inherit the asset index, image manifest, fingerprints and
+    rendered sections copy-on-write, and any missing precompressed assets
+    are written once here instead of each building their own. Requesting
+    every route once here also leaves the compressed component suites and
+    Dash's first-request setup for the workers to inherit.
+    gc.freeze() keeps the collector from touching (and so copying) those
+    objects in the workers. Image bytes are never held in Python: they are
+    streamed from disk, so the OS page cache already shares them.
+    """
+    load_asset_index()
+    load_image_manifest()
+    precompress_assets()
+    for name in HOME_SECTIONS:
+        layout_cache.get(name)
+    warm_routes()
+    gc.collect()
+    gc.freeze()
+
+
+def request_page_path():
+    """Path of the page being loaded, or None when it cannot be told.
+
+    The browser fetches /_dash-layout from the page itself, so its Referer
+    carries the page path.
+    """
+    if not flask.has_request_context():
+        return None
+    if not flask.request.path.endswith('_dash-layout'):
+        return flask.request.path
+    referrer = flask.request.referrer
+    return urlsplit(referrer).path if referrer else None
+
+
+def resume_version(pathname):
+    """Resume version shown at a URL path, or None for paths that show the portfolio."""
+    if pathname == '/resume':
+        return DEFAULT_RESUME
+    if pathname and pathname.startswith('/resume/') and pathname[len('/resume/'):] in RESUME_VERSIONS:
+        return pathname[len('/resume/'):]
+    return None
+
+
+def create_home_page():
+    return html.Div([layout_cache.get(name) for name in HOME_SECTIONS])
+
+
+def serve_layout():
+    # Both pages are in the layout and the router callback below only switches
+    # which one is visible, so navigating never waits on the server. The page
+    # being loaded starts out visible, so the first paint needs no callback.
+    version = resume_version(request_page_path())
+    hidden = {'display': 'none'}
+    return html.Div([
+        dcc.Location(id='url', refresh=False),
+        # '' is the default version shown at /resume
+        dcc.Store(id='resume-urls', data=dict(
+            {'': resume_url(DEFAULT_RESUME)},
+            **{v: resume_url(v) for v, (_, path) in RESUME_VERSIONS.items() if os.path.isfile(path)})),
+        navbar,  # Navbar is now part of the initial layout
+        html.Div([
+            html.Div(create_home_page(), id='home-page', style=hidden if version else None),
+            html.Div(create_resume_page(version), id='resume-page', style=None if version else hidden),
+        ], id='page-content')
+    ])
+
+
+# Layout with navbar and every page included in the initial layout
+app.layout = profiler.timed('layout')(serve_layout)
+
+
+# Navbar toggle
+app.clientside_callback(
+    """
+    function(n, isOpen) {
+        return n ? !isOpen : isOpen;
+    }
+    """,
     Output("navbar-collapse", "is_open"),
     [Input("navbar-toggler", "n_clicks")],
     [State("navbar-collapse", "is_open")],
 )
-def toggle_navbar_collapse(n, is_open):
-    if n:
-        return not is_open
-    return is_open
 
 
-# Callback to render the correct page
-@app.callback(
-    Output('page-content', 'children'),
-    [Input('url', 'pathname')]
+# Router: show the page for the current path. The resume PDF is only loaded
+# once the resume page is shown, and stays loaded when navigating away.
+app.clientside_callback(
+    """
+    function(pathname, resumeUrls, homeStyle) {
+        var match = /^\\/resume(?:\\/([^\\/]+))?$/.exec(pathname || '');
+        var version = match && resumeUrls.hasOwnProperty(match[1] || '') ? match[1] || '' : null;
+        var hidden = {display: 'none'};
+        var wasHome = !(homeStyle && homeStyle.display === 'none');
+        if (wasHome === (version !== null) && !window.location.hash) {
+            window.scrollTo(0, 0);
+        }
+        return [
+            version !== null ? hidden : null,
+            version !== null ? null : hidden,
+            version !== null ? resumeUrls[version] : window.dash_clientside.no_update
+        ];
+    }
+    """,
+    [Output('home-page', 'style'),
+     Output('resume-page', 'style'),
+     Output('resume-frame', 'src')],
+    [Input('url', 'pathname')],
+    [State('resume-urls', 'data'),
+     State('home-page', 'style')]
 )
-def display_page(pathname):
-    if pathname == '/resume':
-        # Display resume page
-        return create_resume_page()
-    else:
-        # Main portfolio page
-        # Add smooth scrolling script inline
-        smooth_scroll_script = html.Script('''
-            // Wait for the DOM to be fully loaded
-            document.addEventListener('DOMContentLoaded', function() {
-                // Function to handle smooth scrolling
-                function smoothScroll(event, targetId) {
-                    event.preventDefault();
-                    const targetElement = document.getElementById(targetId);
-                    if (targetElement) {
-                        window.scrollTo({
-                            top: targetElement.offsetTop - 70,
-                            behavior: 'smooth'
-                        });
-
-                        // Update URL hash without jumping
-                        history.pushState(null, null, '#' + targetId);
-                    }
-                }
-
-                // Add click handlers for all internal hash links
-                function setupScrollHandlers() {
-                    // Handle all links that point to hash targets
-                    document.querySelectorAll('a[href^="#"]').forEach(link => {
-                        if (link.getAttribute('href') !== '#') {
-                            link.addEventListener('click', function(e) {
-                                const targetId = this.getAttribute('href').substring(1);
-                                smoothScroll(e, targetId);
-                            });
-                        }
-                    });
-
-                    // Handle the Contact Me button specifically
-                    const contactBtn = document.querySelector('.contact-btn');
-                    if (contactBtn) {
-                        contactBtn.addEventListener('click', function(e) {
-                            smoothScroll(e, 'contact');
-                        });
-                    }
-                }
-
-                // Initial setup
-                setupScrollHandlers();
-
-                // Set up a MutationObserver to handle dynamically loaded content
-                const observer = new MutationObserver(function(mutations) {
-                    setupScrollHandlers();
-                });
-
-                // Start observing the document with the configured parameters
-                observer.observe(document.body, { childList: true, subtree: true });
-            });
-        ''')
-
-        return html.Div([
-            smooth_scroll_script,
-            create_header(),
-            create_about(),
-            create_projects(),
-            create_achievements(),
-            create_certificates(),
-            create_skills(),
-            create_contact(),
-            create_footer()
-        ])
+
+
+# Load carousel slides around the active one. Off-screen carousels keep
+# autoplaying, so there only the visible slide and the next one are loaded.
+app.clientside_callback(
+    """
+    function(activeIndex, sources, items, id) {
+        var count = items.length;
+        var active = activeIndex || 0;
+        var node = document.getElementById(JSON.stringify({index: id.index, type: id.type}));
+        if (node && node.offsetParent === null) {
+            return window.dash_clientside.no_update;  // on the hidden page
+        }
+        var rect = node ? node.getBoundingClientRect() : null;
+        var nearViewport = !rect || (rect.bottom > -window.innerHeight && rect.top < 2 * window.innerHeight);
+        var offsets = nearViewport ? [-1, 0, 1, 2] : [0, 1];
+        var wanted = offsets.map(function(offset) { return ((active + offset) % count + count) % count; });
+
+        var changed = false;
+        var updated = items.map(function(item, i) {
+            if (wanted.indexOf(i) !== -1 && item.src !== sources[i]) {
+                changed = true;
+                return Object.assign({}, item, {src: sources[i]});
+            }
+            return item;
+        });
+        return changed ? updated : window.dash_clientside.no_update;
+    }
+    """,
+    Output({'type': 'lazy-carousel', 'index': MATCH}, 'items'),
+    [Input({'type': 'lazy-carousel', 'index': MATCH}, 'active_index')],
+    [State({'type': 'lazy-carousel-sources', 'index': MATCH}, 'data'),
+     State({'type': 'lazy-carousel', 'index': MATCH}, 'items'),
+     State({'type': 'lazy-carousel', 'index': MATCH}, 'id')]
+)
+
+
+# SMTP settings; point SMTP_HOST/SMTP_PORT at a local debugging server in tests
+SMTP_HOST = os.environ.get('SMTP_HOST', 'smtp.gmail.com')
+SMTP_PORT = int(os.environ.get('SMTP_PORT', 587))
+SMTP_STARTTLS = os.environ.get('SMTP_STARTTLS', '1').lower() not in ('0', 'false', 'no')
+SMTP_TIMEOUT = 30
+SMTP_POOL_SIZE = int(os.environ.get('SMTP_POOL_SIZE', 2))
+SMTP_IDLE_TIMEOUT = float(os.environ.get('SMTP_IDLE_TIMEOUT', 300))  # close sessions unused this long
+SMTP_NOOP_INTERVAL = 30.0  # health-check a session with NOOP if it sat idle longer than this
+RECIPIENT_EMAIL = "seyeoyelayo@gmail.com"
+
+
+class SMTPPool:
+    """Keeps up to `size` authenticated SMTP sessions open for reuse.
+
+    Idle sessions are health-checked with NOOP before reuse, closed after
+    `idle_timeout` seconds, and a session that drops mid-send is replaced and
+    the message retried once on a fresh connection.
+    """
+
+    def __init__(self, size=SMTP_POOL_SIZE, idle_timeout=SMTP_IDLE_TIMEOUT):
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self._idle = []  # (session, last_used, last_checked), most recently used last
+        self._open = 0
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+        self.connects = 0
+        self.reconnects = 0
+        self.sent = 0
+        self.send_seconds = 0.0
+        self.max_send_seconds = 0.0
+
+    def _connect(self):
+        session = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=SMTP_TIMEOUT)
+        try:
+            if SMTP_STARTTLS:
+                session.starttls()
+            sender_password = os.environ.get('SENDER_PASSWORD')
+            if sender_password:
+                session.login(os.environ.get('SENDER_EMAIL'), sender_password)
+        except Exception:
+            session.close()
+            raise
+        with self._lock:
+            self._open += 1
+            self.connects += 1
+        return session
+
+    def _discard(self, session):
+        try:
+            session.quit()
+        except Exception:
+            session.close()
+        with self._lock:
+            self._open -= 1
+
+    def _healthy(self, session, last_checked):
+        if time.monotonic() - last_checked < SMTP_NOOP_INTERVAL:
+            return True
+        try:
+            return session.noop()[0] == 250
+        except Exception:
+            return False
+
+    def _checkout(self):
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                session, last_used, last_checked = self._idle.pop()
+            if time.monotonic() - last_used < self.idle_timeout and self._healthy(session, last_checked):
+                return session
+            self._discard(session)
+        return self._connect()
+
+    def _checkin(self, session, last_used=None, last_checked=None):
+        now = time.monotonic()
+        with self._lock:
+            self._idle.append((session, last_used or now, last_checked or now))
+
+    def send(self, msg):
+        """Send one message over a pooled session, reconnecting once if the session has gone away."""
+        with self._slots:
+            started = time.perf_counter()
+            session = self._checkout()
+            try:
+                session.send_message(msg)
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                self._discard(session)
+                with self._lock:
+                    self.reconnects += 1
+                session = self._connect()
+                try:
+                    session.send_message(msg)
+                except Exception:
+                    self._discard(session)
+                    raise
+            except Exception:
+                self._discard(session)
+                raise
+            self._checkin(session)
+
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.sent += 1
+                self.send_seconds += elapsed
+                self.max_send_seconds = max(self.max_send_seconds, elapsed)
+
+    def warm(self):
+        """Open one session ahead of the first message."""
+        with self._slots:
+            self._checkin(self._checkout())
+
+    def prune(self):
+        """Close sessions idle past the timeout and NOOP the rest so the server keeps them open."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for session, last_used, last_checked in idle:
+            now = time.monotonic()
+            if now - last_used < self.idle_timeout and self._healthy(session, last_checked):
+                # A NOOP is not a use: keep the idle clock running so the timeout still applies
+                if now - last_checked >= SMTP_NOOP_INTERVAL:
+                    last_checked = now
+                self._checkin(session, last_used, last_checked)
+            else:
+                self._discard(session)
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for session, *_ in idle:
+            self._discard(session)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': self.size,
+                'open': self._open,
+                'idle': len(self._idle),
+                'idle_timeout': self.idle_timeout,
+                'connects': self.connects,
+                'reconnects': self.reconnects,
+                'sent': self.sent,
+                'avg_send_seconds': self.send_seconds / self.sent if self.sent else 0.0,
+                'max_send_seconds': self.max_send_seconds,
+            }
+
+
+smtp_pool = SMTPPool()
 
 
 # Function to send email
 def send_email(name, email, message):
     # Get credentials from environment
     sender_email = os.environ.get('SENDER_EMAIL')
-    sender_password = os.environ.get('SENDER_PASSWORD')
 
-    if not sender_email or not sender_password:
+    if not sender_email:
         return False, "Email configuration error - credentials missing"
 
-    recipient_email = "seyeoyelayo@gmail.com"
-
     # Create message
     msg = MIMEMultipart()
     msg['From'] = sender_email
-    msg['To'] = recipient_email
+    msg['To'] = RECIPIENT_EMAIL
     msg['Subject'] = f"Portfolio Contact: Message from {name}"
 
     # Add message body
@@ -710,17 +1885,354 @@ def send_email(name, email, message):
     msg.attach(MIMEText(body, 'plain'))
 
     try:
-        # Create secure connection
-        server = smtplib.SMTP('smtp.gmail.com', 587)
-        server.starttls()
-        server.login(sender_email, sender_password)
-        server.send_message(msg)
-        server.quit()
+        # Reuse an authenticated session from the pool
+        smtp_pool.send(msg)
         return True, "Message sent successfully!"
     except Exception as e:
         return False, str(e)
 
 
+# Outbound queue: the contact form only writes to this SQLite outbox and a
+# background thread in each worker delivers the messages.
+OUTBOX_PATH = os.environ.get('OUTBOX_PATH', os.path.join(BASE_DIR, 'outbox.sqlite3'))
+OUTBOX_POLL_INTERVAL = 5.0      # seconds between outbox scans when nothing new was queued
+# A claimed message is retried if its sender dies before finishing. The lease has
+# to outlast the slowest send, or another worker claims the row mid-send and the
+# message goes out twice: a NOOP check, a send, then a reconnect (connect,
+# STARTTLS, login) and a second send can each wait up to SMTP_TIMEOUT.
+OUTBOX_SEND_LEASE = 8 * SMTP_TIMEOUT
+OUTBOX_MAX_ATTEMPTS = 8
+OUTBOX_BACKOFF_BASE = 30.0      # first retry after 30s, doubling each attempt
+OUTBOX_BACKOFF_MAX = 6 * 60 * 60
+
+def outbox_connection():
+    conn = sqlite3.connect(OUTBOX_PATH, timeout=10, isolation_level=None)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            email TEXT NOT NULL,
+            message TEXT NOT NULL,
+            created REAL NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt REAL NOT NULL,
+            last_error TEXT
+        )
+    """)
+    return conn
+
+
+def retry_delay(attempts):
+    """Exponential backoff before the next delivery attempt."""
+    return min(OUTBOX_BACKOFF_BASE * 2 ** (attempts - 1), OUTBOX_BACKOFF_MAX)
+
+
+class OutboxSender:
+    """Background thread that drains the outbox with retries and exponential backoff.
+
+    Due messages are sent back to back, so a burst reuses the same pooled SMTP session.
+
+    Several workers may share one outbox: a message is claimed by pushing its
+    next_attempt forward by the lease, so only one sender delivers it and a
+    crashed sender's messages become due again once the lease expires.
+    """
+
+    def __init__(self, send=send_email):
+        self.send = send
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            # Threads do not survive a fork, so each worker starts its own at boot or on first use
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='outbox-sender', daemon=True)
+                self._thread.start()
+
+    def notify(self):
+        self.start()
+        self._wakeup.set()
+
+    def _run(self):
+        while True:
+            try:
+                self.drain()
+            except sqlite3.Error:
+                logger.exception("Outbox drain failed")
+            smtp_pool.prune()
+            self._wakeup.wait(OUTBOX_POLL_INTERVAL)
+            self._wakeup.clear()
+
+    def claim(self, conn):
+        """Claim the oldest due message, or return None when nothing is due."""
+        now = time.time()
+        while True:
+            row = conn.execute(
+                "SELECT id, name, email, message, attempts FROM outbox "
+                "WHERE status = 'pending' AND next_attempt <= ? ORDER BY id LIMIT 1", (now,)
+            ).fetchone()
+            if row is None:
+                return None
+            claimed = conn.execute(
+                "UPDATE outbox SET next_attempt = ? WHERE id = ? AND status = 'pending' AND next_attempt <= ?",
+                (now + OUTBOX_SEND_LEASE, row[0], now)
+            ).rowcount
+            if claimed:
+                return row
+
+    def drain(self):
+        """Deliver every message that is currently due; returns how many were sent."""
+        sent = 0
+        conn = outbox_connection()
+        try:
+            while True:
+                row = self.claim(conn)
+                if row is None:
+                    return sent
+                message_id, name, email, message, attempts = row
+                success, response = self.send(name, email, message)
+                attempts += 1
+                if success:
+                    sent += 1
+                    conn.execute("UPDATE outbox SET status = 'sent', attempts = ?, last_error = NULL WHERE id = ?",
+                                 (attempts, message_id))
+                elif attempts >= OUTBOX_MAX_ATTEMPTS:
+                    logger.error("Giving up on outbox message %s after %s attempts: %s", message_id, attempts, response)
+                    conn.execute("UPDATE outbox SET status = 'failed', attempts = ?, last_error = ? WHERE id = ?",
+                                 (attempts, response, message_id))
+                else:
+                    logger.warning("Outbox message %s failed (attempt %s): %s", message_id, attempts, response)
+                    conn.execute("UPDATE outbox SET attempts = ?, next_attempt = ?, last_error = ? WHERE id = ?",
+                                 (attempts, time.time() + retry_delay(attempts), response, message_id))
+        finally:
+            conn.close()
+
+
+outbox_sender = OutboxSender()
+
+
+def enqueue_email(name, email, message):
+    """Durably queue a contact message for background delivery and return its outbox id."""
+    conn = outbox_connection()
+    try:
+        now = time.time()
+        message_id = conn.execute(
+            "INSERT INTO outbox (name, email, message, created, next_attempt) VALUES (?, ?, ?, ?, ?)",
+            (name, email, message, now, now)
+        ).lastrowid
+    finally:
+        conn.close()
+    outbox_sender.notify()
+    return message_id
+
+
+# Contact form abuse protection: size caps, token-bucket rate limits per client
+# IP and overall, and suppression of repeated identical messages. Rejections
+# are answered without touching the outbox or SMTP.
+CONTACT_MAX_NAME = 200
+CONTACT_MAX_EMAIL = 254
+CONTACT_MAX_MESSAGE = 5000
+# Messages allowed per hour (also the burst size); 0 disables the limit
+CONTACT_IP_PER_HOUR = int(os.environ.get('CONTACT_IP_PER_HOUR', 5))
+CONTACT_GLOBAL_PER_HOUR = int(os.environ.get('CONTACT_GLOBAL_PER_HOUR', 60))
+CONTACT_DEDUP_WINDOW = int(os.environ.get('CONTACT_DEDUP_WINDOW', 24 * 60 * 60))  # seconds; 0 disables
+RATE_LIMIT_BACKEND = os.environ.get('RATE_LIMIT_BACKEND', 'memory')  # 'sqlite' shares limits across workers
+
+# Number of reverse proxies in front of the app, so the client IP is read from X-Forwarded-For
+PROXY_HOPS = int(os.environ.get('PROXY_HOPS', 0))
+if PROXY_HOPS:
+    server.wsgi_app = ProxyFix(server.wsgi_app, x_for=PROXY_HOPS, x_proto=PROXY_HOPS)
+
+
+class MemoryContactGuard:
+    """Token buckets and recently seen message hashes kept in this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}  # key -> (tokens, updated)
+        self._seen = {}  # message hash -> time first seen
+
+    def take(self, key, capacity, refill_per_second):
+        """Take one token from the bucket; False when it is empty."""
+        now = time.time()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * refill_per_second)
+            if tokens < 1:
+                self._buckets[key] = (tokens, now)
+                return False
+            self._buckets[key] = (tokens - 1, now)
+            if len(self._buckets) > 10000:
+                # Buckets refilled to capacity carry no state and can be dropped
+                self._buckets = {k: v for k, v in self._buckets.items()
+                                 if v[0] + (now - v[1]) * refill_per_second < capacity}
+            return True
+
+    def is_duplicate(self, digest, window):
+        """True if the same message was seen within `window` seconds; records it otherwise."""
+        now = time.time()
+        with self._lock:
+            first_seen = self._seen.get(digest)
+            if first_seen is not None and now - first_seen < window:
+                return True
+            self._seen[digest] = now
+            if len(self._seen) > 10000:
+                self._seen = {k: t for k, t in self._seen.items() if now - t < window}
+            return False
+
+    def forget(self, digest):
+        """Drop a recorded message, e.g. one that could not be queued after all."""
+        with self._lock:
+            self._seen.pop(digest, None)
+
+
+class SQLiteContactGuard:
+    """Same checks as MemoryContactGuard, stored next to the outbox so every worker shares them."""
+
+    def __init__(self, path=OUTBOX_PATH):
+        self.path = path
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('CREATE TABLE IF NOT EXISTS rate_limits (key TEXT PRIMARY KEY, tokens REAL, updated REAL)')
+        conn.execute('CREATE TABLE IF NOT EXISTS recent_messages (digest TEXT PRIMARY KEY, seen REAL)')
+        return conn
+
+    def take(self, key, capacity, refill_per_second):
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute('SELECT tokens, updated FROM rate_limits WHERE key = ?', (key,)).fetchone()
+            tokens, updated = row if row else (capacity, now)
+            tokens = min(capacity, tokens + (now - updated) * refill_per_second)
+            allowed = tokens >= 1
+            conn.execute('INSERT OR REPLACE INTO rate_limits (key, tokens, updated) VALUES (?, ?, ?)',
+                         (key, tokens - 1 if allowed else tokens, now))
+            conn.execute('COMMIT')
+            return allowed
+        finally:
+            conn.close()
+
+    def is_duplicate(self, digest, window):
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute('DELETE FROM recent_messages WHERE seen < ?', (now - window,))
+            duplicate = conn.execute('SELECT 1 FROM recent_messages WHERE digest = ?', (digest,)).fetchone()
+            if not duplicate:
+                conn.execute('INSERT INTO recent_messages (digest, seen) VALUES (?, ?)', (digest, now))
+            conn.execute('COMMIT')
+            return duplicate is not None
+        finally:
+            conn.close()
+
+    def forget(self, digest):
+        conn = self._connect()
+        try:
+            conn.execute('DELETE FROM recent_messages WHERE digest = ?', (digest,))
+        finally:
+            conn.close()
+
+
+contact_guard = SQLiteContactGuard() if RATE_LIMIT_BACKEND == 'sqlite' else MemoryContactGuard()
+contact_stats = {'accepted': 0, 'throttled': 0, 'deduped': 0, 'too_large': 0}
+_contact_stats_lock = threading.Lock()
+
+
+def count_contact(outcome):
+    # gthread workers serve submissions concurrently, and += on a dict entry is not atomic
+    with _contact_stats_lock:
+        contact_stats[outcome] += 1
+
+
+def client_ip():
+    return flask.request.remote_addr if flask.has_request_context() else 'local'
+
+
+def contact_digest(name, email, message):
+    """Hash identifying a message regardless of case and whitespace, for duplicate suppression."""
+    return hashlib.sha256('\0'.join((name.strip().lower(), email.strip().lower(),
+                                     ' '.join(message.split()))).encode()).hexdigest()
+
+
+def check_contact_message(name, email, message, digest):
+    """Reason and HTTP status for rejecting a submission, or None to accept it.
+
+    The duplicate check runs last, since it records the message: a message
+    turned away by an earlier check can be sent again later.
+    """
+    for field, value, limit in (('Name', name, CONTACT_MAX_NAME), ('Email', email, CONTACT_MAX_EMAIL),
+                                ('Message', message, CONTACT_MAX_MESSAGE)):
+        if len(value) > limit:
+            count_contact('too_large')
+            return f"{field} is too long (maximum {limit} characters)", 413
+    if CONTACT_IP_PER_HOUR and not contact_guard.take(f'ip:{client_ip()}', CONTACT_IP_PER_HOUR,
+                                                      CONTACT_IP_PER_HOUR / 3600):
+        count_contact('throttled')
+        return "Too many messages, please try again later", 429
+    if CONTACT_GLOBAL_PER_HOUR and not contact_guard.take('global', CONTACT_GLOBAL_PER_HOUR,
+                                                          CONTACT_GLOBAL_PER_HOUR / 3600):
+        count_contact('throttled')
+        return "Too many messages, please try again later", 429
+    if CONTACT_DEDUP_WINDOW and contact_guard.is_duplicate(digest, CONTACT_DEDUP_WINDOW):
+        count_contact('deduped')
+        return "This message has already been sent", 409
+    return None
+
+
+def queue_contact_message(name, email, message):
+    """Queue the email; the outbox sender delivers it in the background.
+
+    Returns (success, response, HTTP status).
+    """
+    digest = contact_digest(name, email, message)
+    recorded = False
+    try:
+        rejection = check_contact_message(name, email, message, digest)
+        if rejection:
+            return False, rejection[0], rejection[1]
+        recorded = bool(CONTACT_DEDUP_WINDOW)
+        enqueue_email(name, email, message)
+        count_contact('accepted')
+        return True, "Message queued", 200
+    except sqlite3.Error as e:
+        if recorded:
+            # Not queued, so a retry must not be turned away as a duplicate
+            try:
+                contact_guard.forget(digest)
+            except sqlite3.Error:
+                logger.exception("Could not forget an unqueued contact message")
+        return False, str(e), 503
+
+
+# Plain form endpoint used by the static export (python build.py export)
+CONTACT_ALLOWED_ORIGIN = os.environ.get('CONTACT_ALLOWED_ORIGIN', '*')
+
+
+@server.route('/api/contact', methods=['POST'])
+def contact_endpoint():
+    name, email, message = (flask.request.form.get(field, '').strip() for field in ('name', 'email', 'message'))
+    if not name or not email or not message:
+        success, response, status = False, "Please fill in all fields", 400
+    else:
+        success, response, status = queue_contact_message(name, email, message)
+        if success:
+            response = "Thank you for your message! I'll get back to you soon."
+        else:
+            response = f"Failed to send message: {response}"
+
+    result = flask.jsonify(ok=success, message=response)
+    result.status_code = status
+    result.headers['Access-Control-Allow-Origin'] = CONTACT_ALLOWED_ORIGIN
+    return result
+
+
 # Callback for form submission
 @app.callback(
     Output('contact-alert', 'children'),
@@ -729,6 +2241,7 @@ def send_email(name, email, message):
      State('contact-email', 'value'),
      State('contact-message', 'value')]
 )
+@profiler.timed('callback')
 def submit_form(n_clicks, name, email, message):
     if n_clicks is None:
         return ""
@@ -741,8 +2254,7 @@ def submit_form(n_clicks, name, email, message):
             is_open=True,
         )
 
-    # Actually send the email
-    success, response = send_email(name, email, message)
+    success, response, _ = queue_contact_message(name, email, message)
 
     if success:
         return dbc.Alert(
@@ -766,8 +2278,160 @@ def submit_form(n_clicks, name, email, message):
         )
 
 
+# Warm-up: each worker requests every page, its layout and the assets the page
+# loads once, through the full Flask stack, so Dash's first-request setup, the
+# layout cache and the compressed component suites are filled before visitors
+# arrive. /ready answers 503 until that has finished, so a load balancer only
+# routes to hot workers; /healthz only says the process is serving. An SMTP
+# session is opened afterwards, when credentials are configured.
+WARMUP_PAGES = ['/', '/resume']
+
+
+class WarmUp:
+    """Runs the warm-up once per process in a background thread and records its outcome."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread = None
+        self.done = threading.Event()
+        self.seconds = None
+        self.errors = []
+
+    def start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self.run, name='warm-up', daemon=True)
+                self._thread.start()
+
+    def run(self):
+        started = time.perf_counter()
+        try:
+            # Servers without the gunicorn hook get here through /ready
+            outbox_sender.start()
+            warm_routes(self.errors)
+        except Exception as e:
+            logger.exception("Warm-up failed")
+            self.errors.append(f'warm-up: {e}')
+        finally:
+            # Whatever happened, a worker that never reports ready would stay out of rotation for good
+            self.seconds = time.perf_counter() - started
+            self.done.set()
+            logger.info("Warm-up finished in %.2fs%s", self.seconds,
+                        f" with errors: {'; '.join(self.errors)}" if self.errors else '')
+        # Opened only once the worker is ready: a slow SMTP host must not hold it back, and messages
+        # queue in the outbox either way
+        if os.environ.get('SENDER_EMAIL'):
+            try:
+                smtp_pool.warm()
+            except (smtplib.SMTPException, OSError) as e:
+                logger.warning("Could not open an SMTP session during warm-up: %s", e)
+
+
+def warm_routes(errors=None):
+    """Request each page, its layout and everything the page loads once, in every encoding offered."""
+    client = server.test_client()
+    urls = [(page, None) for page in WARMUP_PAGES]
+    urls += [('/_dash-layout', f'http://localhost{page}') for page in WARMUP_PAGES]
+    urls += [(url, None) for url in service_worker_precache() + ['/sw.js']]
+    for url, referrer in dict.fromkeys(urls):
+        for encoding in ENCODINGS:
+            headers = {'Accept-Encoding': encoding, 'Referer': referrer} if referrer else {'Accept-Encoding': encoding}
+            try:
+                response = client.get(url, headers=headers)
+                response.close()
+                if response.status_code >= 400:
+                    raise RuntimeError(f'HTTP {response.status_code}')
+            except Exception as e:
+                logger.exception("Warm-up request for %s failed", url)
+                if errors is not None:
+                    errors.append(f'{url}: {e}')
+                break
+
+
+warm_up = WarmUp()
+
+
+@server.route('/ready')
+def ready():
+    # Started here as well, so servers that never call warm_up.start() still become ready
+    warm_up.start()
+    if not warm_up.done.is_set():
+        response = flask.jsonify(status='warming')
+        response.status_code = 503
+    else:
+        response = flask.jsonify(status='ready', warm_up_seconds=round(warm_up.seconds, 3), errors=warm_up.errors)
+    response.cache_control.no_store = True
+    return response
+
+
+@server.route('/healthz')
+def healthz():
+    response = flask.jsonify(status='ok')
+    response.cache_control.no_store = True
+    return response
+
+
+if PROFILING:
+    @server.before_request
+    def start_request_timer():
+        flask.g.request_started = time.perf_counter()
+
+    @server.after_request
+    def add_server_timing(response):
+        total = time.perf_counter() - flask.g.get('request_started', time.perf_counter())
+        profiler.record('request', flask.request.endpoint or 'unknown', total)
+        timings = [(name, seconds) for name, seconds in flask.g.get('server_timings', [])
+                   if not name.startswith('request-')]
+        timings.append(('total', total))
+        response.headers['Server-Timing'] = ', '.join(f'{name};dur={seconds * 1000:.2f}' for name, seconds in timings)
+        return response
+
+
+@server.route('/metrics')
+def metrics():
+    """Prometheus text exposition of the layout cache, SMTP pool and contact form counters.
+
+    The profiler's timings and section sizes are included when PROFILING is on.
+    """
+    lines = []
+    if PROFILING:
+        for kind in ('section', 'serialize', 'callback', 'layout', 'request'):
+            metric = f'portfolio_{kind}_seconds'
+            lines.append(f'# TYPE {metric} summary')
+            for (entry_kind, name), (count, total) in sorted(profiler.timings.items()):
+                if entry_kind == kind:
+                    lines.append(f'{metric}_count{{name="{name}"}} {count}')
+                    lines.append(f'{metric}_sum{{name="{name}"}} {total:.6f}')
+        lines.append('# TYPE portfolio_section_payload_bytes gauge')
+        for name, size in sorted(profiler.payload_bytes.items()):
+            lines.append(f'portfolio_section_payload_bytes{{name="{name}"}} {size}')
+    lines.append('# TYPE portfolio_layout_cache_hits_total counter')
+    lines.append(f'portfolio_layout_cache_hits_total {layout_cache.hits}')
+    lines.append('# TYPE portfolio_layout_cache_misses_total counter')
+    lines.append(f'portfolio_layout_cache_misses_total {layout_cache.misses}')
+    pool = smtp_pool.stats()
+    for key, metric, metric_type in (('size', 'size', 'gauge'), ('idle_timeout', 'idle_timeout_seconds', 'gauge'),
+                                     ('open', 'open', 'gauge'), ('idle', 'idle', 'gauge'),
+                                     ('sent', 'sent_total', 'counter'), ('connects', 'connects_total', 'counter'),
+                                     ('reconnects', 'reconnects_total', 'counter'),
+                                     ('avg_send_seconds', 'avg_send_seconds', 'gauge'),
+                                     ('max_send_seconds', 'max_send_seconds', 'gauge')):
+        lines.append(f'# TYPE portfolio_smtp_pool_{metric} {metric_type}')
+        lines.append(f'portfolio_smtp_pool_{metric} {pool[key]}')
+    lines.append('# TYPE portfolio_contact_submissions_total counter')
+    with _contact_stats_lock:
+        outcomes = dict(contact_stats)
+    for outcome, count in outcomes.items():
+        lines.append(f'portfolio_contact_submissions_total{{outcome="{outcome}"}} {count}')
+    response = flask.Response('\n'.join(lines) + '\n', mimetype='text/plain; version=0.0.4')
+    response.cache_control.no_store = True
+    return response
+
+
 if __name__ == '__main__':
+    # Development server only; production runs `gunicorn app:server` (see gunicorn.conf.py).
+    # The debugger and reloader are opt-in with DEBUG=1.
     port = int(os.environ.get("PORT", 8050))
-    app.run_server(port=port, host='0.0.0.0', debug = True)
+    app.run_server(port=port, host='0.0.0.0', debug=os.environ.get('DEBUG') == '1')
 
 
@@ -1,49 +1,59 @@
-// Wait for the DOM to be fully loaded
-document.addEventListener('DOMContentLoaded', function() {
-    // Function to handle smooth scrolling
-    function smoothScroll(event, targetId) {
-        event.preventDefault();
-        const targetElement = document.getElementById(targetId);
-        if (targetElement) {
-            window.scrollTo({
-                top: targetElement.offsetTop - 70,
-                behavior: 'smooth'
+// Smooth scrolling for in-page links. One delegated listener on the document
+// covers links Dash renders later, so nothing has to be rebound as the page
+// changes. Sections are offset below the fixed navbar by scroll-padding-top
+// in custom.css.
+(function() {
+    // Scroll once the section is displayed; after a client-side switch from
+    // another page the router shows the home page a frame or two later.
+    function scrollToSection(id, framesLeft) {
+        var target = document.getElementById(id);
+        if (target && target.offsetParent !== null) {
+            target.scrollIntoView({behavior: 'smooth'});
+        } else if (framesLeft > 0) {
+            window.requestAnimationFrame(function() {
+                scrollToSection(id, framesLeft - 1);
             });
-            
-            // Update URL hash without jumping
-            history.pushState(null, null, '#' + targetId);
         }
     }
-    
-    // Add click handlers for all internal hash links
-    function setupScrollHandlers() {
-        // Handle all links that point to hash targets
-        document.querySelectorAll('a[href^="#"]').forEach(link => {
-            if (link.getAttribute('href') !== '#') {
-                link.addEventListener('click', function(e) {
-                    const targetId = this.getAttribute('href').substring(1);
-                    smoothScroll(e, targetId);
-                });
+
+    document.addEventListener('click', function(event) {
+        if (event.defaultPrevented || event.button !== 0 ||
+                event.metaKey || event.ctrlKey || event.shiftKey || event.altKey) {
+            return;
+        }
+        var link = event.target.closest('a[href*="#"]');
+        if (!link || link.target === '_blank') {
+            return;
+        }
+        var url = new URL(link.href, window.location.href);
+        var id = decodeURIComponent(url.hash.slice(1));
+        if (!id || url.origin !== window.location.origin) {
+            return;
+        }
+        if (url.pathname !== window.location.pathname) {
+            if (url.pathname !== '/' || !document.getElementById('home-page')) {
+                return;  // a page that is not part of this layout: let the browser load it
             }
-        });
-        
-        // Handle the Contact Me button specifically
-        const contactBtn = document.querySelector('.contact-btn');
-        if (contactBtn) {
-            contactBtn.addEventListener('click', function(e) {
-                smoothScroll(e, 'contact');
-            });
+            // The home page is already in the layout: switch to it the way
+            // dcc.Link does, without reloading
+            event.preventDefault();
+            window.history.pushState(null, '', url.pathname + url.hash);
+            window.dispatchEvent(new CustomEvent('_dashprivate_pushstate'));
+            scrollToSection(id, 30);
+            return;
         }
-    }
-    
-    // Initial setup
-    setupScrollHandlers();
-    
-    // Set up a MutationObserver to handle dynamically loaded content
-    const observer = new MutationObserver(function(mutations) {
-        setupScrollHandlers();
+        event.preventDefault();
+        if (url.hash !== window.location.hash) {
+            window.history.pushState(null, '', url.hash);
+        }
+        scrollToSection(id, 0);
     });
-    
-    // Start observing the document with the configured parameters
-    observer.observe(document.body, { childList: true, subtree: true });
-}); 
\ No newline at end of file
+
+    // Offline support and instant repeat visits, see /sw.js. Only the Dash app
+    // registers it; the static export has no worker to register.
+    if ('serviceWorker' in navigator && document.getElementById('react-entry-point')) {
+        window.addEventListener('load', function() {
+            navigator.serviceWorker.register('/sw.js');
+        });
+    }
+})();
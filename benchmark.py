@@ -0,0 +1,392 @@
+"""Load and page-weight benchmark for the portfolio app.
+
+Boots `server` in-process (or under gunicorn), replays the requests a browser
+makes for `/` and `/resume` plus contact-form submissions against a local
+SMTP sink, and writes latency percentiles, throughput, response bytes and
+worker RSS to a JSON file so runs can be compared across commits. It also
+times the loading waterfall of each page with and without its Link preload
+header:
+
+    python benchmark.py --requests 200 --concurrency 8 --out bench.json
+    python benchmark.py --gunicorn 4 --compare bench.json
+"""
+import argparse
+import http.client
+import json
+import os
+import re
+import signal
+import socket
+import socketserver
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class SMTPSink(socketserver.ThreadingTCPServer):
+    """Minimal SMTP server that accepts and counts every message."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), SMTPSinkHandler)
+        self.messages = 0
+        self.lock = threading.Lock()
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+
+class SMTPSinkHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(line.encode() + b'\r\n')
+
+    def handle(self):
+        self.reply('220 benchmark sink')
+        in_data = False
+        for line in self.rfile:
+            if in_data:
+                if line == b'.\r\n':
+                    in_data = False
+                    with self.server.lock:
+                        self.server.messages += 1
+                    self.reply('250 OK')
+                continue
+            command = line[:4].upper()
+            if command in (b'EHLO', b'HELO'):
+                self.reply('250 sink')
+            elif command == b'DATA':
+                in_data = True
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+            elif command == b'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('250 OK')
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def process_rss_mb(pid):
+    """Resident set size of a process in MB (Linux only; None elsewhere)."""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+
+
+def child_pids(pid):
+    try:
+        with open(f'/proc/{pid}/task/{pid}/children') as f:
+            return [int(child) for child in f.read().split()]
+    except OSError:
+        return []
+
+
+class InProcessServer:
+    """Runs app.server on a threaded Werkzeug server inside this process."""
+
+    def __init__(self, port):
+        from werkzeug.serving import WSGIRequestHandler, make_server
+        import app
+
+        class QuietHandler(WSGIRequestHandler):
+            def log_request(self, *args, **kwargs):
+                pass
+
+        self.httpd = make_server('127.0.0.1', port, app.server, threaded=True, request_handler=QuietHandler)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def worker_pids(self):
+        return [os.getpid()]
+
+    def stop(self):
+        self.httpd.shutdown()
+
+
+class GunicornServer:
+    """Runs `gunicorn app:server` with the repo's gunicorn.conf.py in a subprocess."""
+
+    def __init__(self, port, workers):
+        self.process = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', '-w', str(workers), '-b', f'127.0.0.1:{port}', 'app:server'],
+            cwd=BASE_DIR, env=os.environ.copy(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        self.workers = workers
+
+    def worker_pids(self):
+        return child_pids(self.process.pid)
+
+    def stop(self):
+        self.process.send_signal(signal.SIGTERM)
+        self.process.wait(timeout=30)
+
+
+def wait_until_up(port, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+        try:
+            conn.request('GET', '/ready')  # 503 until the worker has warmed up
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        finally:
+            conn.close()
+        time.sleep(0.2)
+    sys.exit(f"Server did not come up on port {port}")
+
+
+def callback_request(dependencies, output_id, inputs, state=()):
+    """Body for a _dash-update-component call to the callback that outputs `output_id`."""
+    callback = next(d for d in dependencies if output_id in d['output'])
+    output = callback['output']
+    if output.startswith('..'):
+        outputs = [dict(zip(('id', 'property'), o.split('.'))) for o in output.strip('.').split('...')]
+    else:
+        outputs = dict(zip(('id', 'property'), output.split('.')))
+    return json.dumps({
+        'output': output,
+        'outputs': outputs,
+        'inputs': [dict(i, value=v) for i, v in zip(callback['inputs'], inputs)],
+        'state': [dict(s, value=v) for s, v in zip(callback['state'], state)],
+        'changedPropIds': [f"{callback['inputs'][0]['id']}.{callback['inputs'][0]['property']}"],
+    }).encode()
+
+
+def scenarios(dependencies):
+    """(name, method, path, body, headers) for each request type a visitor produces."""
+    json_headers = {'Content-Type': 'application/json'}
+    return [
+        ('index', 'GET', '/', None, {}),
+        ('layout-home', 'GET', '/_dash-layout', None, {'Referer': 'http://localhost/'}),
+        ('layout-resume', 'GET', '/_dash-layout', None, {'Referer': 'http://localhost/resume'}),
+        ('contact', 'POST', '/_dash-update-component',
+         callback_request(dependencies, 'contact-alert.children', [1],
+                          ['Benchmark', 'bench@example.com', 'Load test message']), json_headers),
+    ]
+
+
+def run_scenario(port, scenario, requests, concurrency, extra_headers):
+    name, method, path, body, headers = scenario
+    headers = dict(headers, **extra_headers)
+    local = threading.local()
+
+    def one(_):
+        conn = getattr(local, 'conn', None)
+        if conn is None:
+            conn = local.conn = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+        started = time.perf_counter()
+        conn.request(method, path, body=body, headers=headers)
+        response = conn.getresponse()
+        size = len(response.read())
+        return time.perf_counter() - started, size, response.status, response.getheader('Content-Encoding')
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        results = list(pool.map(one, range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(r[0] for r in results)
+
+    def percentile(q):
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000
+
+    return {
+        'requests': requests,
+        'concurrency': concurrency,
+        'errors': sum(1 for r in results if r[2] >= 400),
+        'p50_ms': round(percentile(0.50), 2),
+        'p95_ms': round(percentile(0.95), 2),
+        'p99_ms': round(percentile(0.99), 2),
+        'mean_ms': round(statistics.mean(latencies) * 1000, 2),
+        'throughput_rps': round(requests / elapsed, 1),
+        'response_bytes': results[-1][1],
+        'content_encoding': results[-1][3],
+    }
+
+
+WATERFALL_PAGES = ['/', '/resume']
+
+
+def page_waterfall(port, path, use_hints, extra_headers, rtt, connections):
+    """Milliseconds until a page and everything Dash needs to render it have arrived.
+
+    Loads like a browser: the page, then the stylesheets and scripts it
+    references, then the layout and dependencies once the scripts have run.
+    With `use_hints`, everything in the page's Link header is requested as
+    soon as its headers arrive. Each request waits `rtt` seconds first to
+    stand in for the network round trip, and at most `connections` are in
+    flight at once. Returns (milliseconds, requests made).
+    """
+    local = threading.local()
+    headers = dict(extra_headers, Referer=f'http://127.0.0.1:{port}{path}')
+
+    def get(url):
+        conn = getattr(local, 'conn', None)
+        if conn is None:
+            conn = local.conn = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+        time.sleep(rtt)
+        conn.request('GET', url, headers=headers)
+        conn.getresponse().read()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(connections) as pool:
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+        time.sleep(rtt)
+        conn.request('GET', path)  # uncompressed, so the links can be read from it
+        response = conn.getresponse()
+        requested = []
+        if use_hints:
+            requested = re.findall(r'<(/[^>]*)>;[^,]*rel=preload', response.getheader('Link') or '')
+        pending = [pool.submit(get, url) for url in requested]
+        page = response.read().decode()
+        conn.close()
+
+        referenced = re.findall(r'<link rel="stylesheet" href="(/[^"]+)"', page)
+        referenced += re.findall(r'<script src="(/[^"]+)"', page)
+        pending += [pool.submit(get, url) for url in referenced if url not in requested]
+        for future in pending:
+            future.result()  # the renderer starts once every script has loaded
+
+        renderer = [url for url in ('/_dash-dependencies', '/_dash-layout') if url not in requested]
+        for future in [pool.submit(get, url) for url in renderer]:
+            future.result()
+    return (time.perf_counter() - started) * 1000, 1 + len(set(requested) | set(referenced)) + len(renderer)
+
+
+def run_waterfall(port, path, repeats, extra_headers, rtt, connections):
+    result = {'rtt_ms': rtt * 1000, 'connections': connections}
+    for use_hints in (False, True):
+        runs = [page_waterfall(port, path, use_hints, extra_headers, rtt, connections) for _ in range(repeats)]
+        key = 'with_hints' if use_hints else 'without_hints'
+        result[f'{key}_ms'] = round(statistics.median(ms for ms, _ in runs), 2)
+        result[f'{key}_requests'] = runs[-1][1]
+    return result
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print(f"\nvs {baseline_path} (commit {baseline.get('commit')})")
+    for name, current in results['scenarios'].items():
+        before = baseline['scenarios'].get(name)
+        if not before:
+            continue
+        deltas = ' '.join(f"{key} {before[key]} -> {current[key]}"
+                          for key in ('p50_ms', 'p95_ms', 'throughput_rps', 'response_bytes'))
+        print(f"  {name:<14} {deltas}")
+    for path, current in results.get('waterfall', {}).items():
+        before = baseline.get('waterfall', {}).get(path)
+        if before:
+            print(f"  waterfall {path:<8} without hints {before['without_hints_ms']} -> {current['without_hints_ms']} "
+                  f"with hints {before['with_hints_ms']} -> {current['with_hints_ms']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=200, help='requests per scenario (default: 200)')
+    parser.add_argument('--concurrency', type=int, default=8, help='concurrent clients (default: 8)')
+    parser.add_argument('--gunicorn', type=int, metavar='WORKERS',
+                        help='run under gunicorn with this many workers instead of in-process')
+    parser.add_argument('--only', nargs='*', help='run only these scenarios ("waterfall" for the page waterfalls)')
+    parser.add_argument('--header', action='append', default=[], metavar='NAME:VALUE',
+                        help='extra request header, e.g. "Accept-Encoding: br"')
+    parser.add_argument('--rtt', type=float, default=50, metavar='MS',
+                        help='simulated round trip per request in the page waterfalls (default: %(default)s)')
+    parser.add_argument('--connections', type=int, default=6,
+                        help='parallel requests in the page waterfalls: 6 is a browser over HTTP/1.1, '
+                             'use more to model HTTP/2 multiplexing (default: %(default)s)')
+    parser.add_argument('--out', default='bench_results.json', help='where to write results (default: %(default)s)')
+    parser.add_argument('--compare', metavar='RESULTS_JSON', help='print deltas against an earlier results file')
+    args = parser.parse_args()
+
+    # The app reads its SMTP and outbox settings at import, so point them at the sink first
+    sink = SMTPSink()
+    outbox = tempfile.NamedTemporaryFile(suffix='.sqlite3', delete=False)
+    os.environ.update(SMTP_HOST='127.0.0.1', SMTP_PORT=str(sink.port), SMTP_STARTTLS='0',
+                      SENDER_EMAIL='benchmark@example.com', SENDER_PASSWORD='', OUTBOX_PATH=outbox.name,
+                      CONTACT_IP_PER_HOUR='0', CONTACT_GLOBAL_PER_HOUR='0', CONTACT_DEDUP_WINDOW='0')
+
+    port = free_port()
+    server = GunicornServer(port, args.gunicorn) if args.gunicorn else InProcessServer(port)
+    extra_headers = dict(h.split(':', 1) for h in args.header)
+    extra_headers = {k.strip(): v.strip() for k, v in extra_headers.items()}
+    try:
+        wait_until_up(port)
+        conn = http.client.HTTPConnection('127.0.0.1', port)
+        conn.request('GET', '/_dash-dependencies')
+        dependencies = json.loads(conn.getresponse().read())
+
+        results = {
+            'commit': git_commit(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'mode': f'gunicorn x{args.gunicorn}' if args.gunicorn else 'in-process',
+            'scenarios': {},
+        }
+        for scenario in scenarios(dependencies):
+            if args.only and scenario[0] not in args.only:
+                continue
+            result = run_scenario(port, scenario, args.requests, args.concurrency, extra_headers)
+            results['scenarios'][scenario[0]] = result
+            print(f"{scenario[0]:<14} p50 {result['p50_ms']:>8.2f} ms  p95 {result['p95_ms']:>8.2f} ms  "
+                  f"p99 {result['p99_ms']:>8.2f} ms  {result['throughput_rps']:>8.1f} req/s  "
+                  f"{result['response_bytes']:>9,} bytes  {result['errors']} errors")
+
+        if not args.only or 'waterfall' in args.only:
+            results['waterfall'] = {}
+            for path in WATERFALL_PAGES:
+                result = run_waterfall(port, path, max(args.requests // 20, 5), extra_headers,
+                                       args.rtt / 1000, args.connections)
+                results['waterfall'][path] = result
+                print(f"waterfall {path:<8} without hints {result['without_hints_ms']:>8.2f} ms "
+                      f"({result['without_hints_requests']} requests)  with hints {result['with_hints_ms']:>8.2f} ms "
+                      f"({result['with_hints_requests']} requests)")
+
+        if 'contact' in results['scenarios']:
+            # Give the background senders a moment to drain the outbox into the sink
+            deadline = time.monotonic() + 30
+            while sink.messages < args.requests and time.monotonic() < deadline:
+                time.sleep(0.2)
+            results['scenarios']['contact']['delivered'] = sink.messages
+            print(f"contact        {sink.messages}/{args.requests} messages delivered to the SMTP sink")
+
+        results['worker_rss_mb'] = [round(rss, 1) for rss in map(process_rss_mb, server.worker_pids()) if rss]
+        print(f"worker RSS (MB): {results['worker_rss_mb']}")
+    finally:
+        server.stop()
+        os.unlink(outbox.name)
+
+    with open(args.out, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.out}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,993 @@
+"""Offline build steps for the portfolio.
+
+Run from the repository root before deploying:
+
+    python build.py images    # responsive WebP/JPEG variants of the gallery images
+    python build.py export    # pre-rendered static site for CDN hosting
+    python build.py index     # asset index: size, dimensions, blurred preview, hash and title of every image
+    python build.py compress  # Brotli/gzip copies of the static assets
+    python build.py documents # first-page previews of the resume PDFs
+    python build.py certificates  # catalog data/certificate, rendering new or changed PDFs (before images and index)
+    python build.py vendor    # self-hosted, subsetted copies of the third-party CSS and fonts
+    python build.py bundle    # minified, precompressed script and stylesheet bundles (after vendor)
+"""
+import argparse
+import base64
+import hashlib
+import html
+import io
+import itertools
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, unquote, urljoin, urlsplit
+
+from plotly.io.json import to_json_plotly
+
+import app as portfolio
+from app import (ASSET_INDEX, BASE_DIR, BUNDLE_BUILD_DIR, BUNDLE_MANIFEST, BUNDLES, CERTIFICATE_CATALOG,
+                 CERTIFICATE_EXTENSIONS, DOCUMENT_BUILD_DIR, DOCUMENT_MANIFEST, DOCUMENT_PREVIEW_WIDTH,
+                 ENCODING_SUFFIXES, ENCODINGS, IMAGE_DIRS, IMAGE_BUILD_DIR, IMAGE_MANIFEST, IMAGE_WIDTHS,
+                 PLACEHOLDER_SIZE, RESUME_VERSIONS, VENDOR_DIR, VENDOR_MANIFEST, VENDOR_SCRIPTS, VENDOR_STYLESHEETS,
+                 bundle_build, bundle_fingerprint, compress_bytes, concatenate_sources, describe_asset,
+                 file_fingerprint, image_variants, list_images, parse_title, pick_variant, precompress_assets)
+
+try:
+    from PIL import Image, ImageFilter
+except ImportError:  # Pillow is only needed for the build, not for serving
+    Image = None
+
+try:
+    import rcssmin
+    import rjsmin
+except ImportError:  # bundles are then shipped unminified
+    rcssmin = rjsmin = None
+
+try:
+    from fontTools import subset as font_subset
+except ImportError:  # vendored fonts are then shipped whole
+    font_subset = None
+
+try:
+    import pymupdf  # renders PDF pages without an external tool
+except ImportError:
+    pymupdf = None
+
+# Encoder settings per output format: (Pillow format name, extension, save options)
+IMAGE_FORMATS = {
+    'webp': ('WEBP', 'webp', {'quality': 80, 'method': 6}),
+    'jpeg': ('JPEG', 'jpg', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+
+def variant_widths(width):
+    """Target widths for an image: every configured width below the original, plus one capped at the largest."""
+    widths = [w for w in IMAGE_WIDTHS if w < width]
+    widths.append(min(width, max(IMAGE_WIDTHS)))
+    return sorted(set(widths))
+
+
+def render_variants(source_path, fingerprint):
+    """Write every width/format variant of one image and return its manifest entry."""
+    with Image.open(source_path) as img:
+        img = img.convert('RGBA') if img.mode in ('P', 'LA') else img
+        if img.mode == 'RGBA':
+            # JPEG has no alpha channel: flatten onto the white page background
+            background = Image.new('RGB', img.size, (255, 255, 255))
+            background.paste(img, mask=img.getchannel('A'))
+            img = background
+        elif img.mode != 'RGB':
+            img = img.convert('RGB')
+
+        variants = []
+        for width in variant_widths(img.width):
+            height = round(img.height * width / img.width)
+            resized = img if width == img.width else img.resize((width, height), Image.LANCZOS)
+            for fmt, (pil_format, ext, options) in IMAGE_FORMATS.items():
+                # Named after the source hash, so unchanged images are never re-encoded
+                file = f'{fingerprint}-{width}.{ext}'
+                out_path = os.path.join(IMAGE_BUILD_DIR, file)
+                if not os.path.exists(out_path):
+                    resized.save(out_path, pil_format, **options)
+                variants.append({
+                    'width': width,
+                    'height': height,
+                    'format': fmt,
+                    'file': file,
+                    'bytes': os.path.getsize(out_path),
+                })
+
+        return {
+            'source_hash': fingerprint,
+            'width': img.width,
+            'height': img.height,
+            'bytes': os.path.getsize(source_path),
+            'variants': variants,
+        }
+
+
+def build_images(args):
+    if Image is None:
+        sys.exit("Pillow is required for the image build: pip install Pillow")
+
+    os.makedirs(IMAGE_BUILD_DIR, exist_ok=True)
+    manifest = {'widths': IMAGE_WIDTHS, 'images': {}}
+    total_before = total_after = 0
+
+    print(f"{'image':<60} {'original':>10} {f'webp@{args.report_width}':>12} {'saved':>7}")
+    for kind in IMAGE_DIRS:
+        for file in list_images(kind):
+            source_path = os.path.join(IMAGE_DIRS[kind], file)
+            entry = render_variants(source_path, file_fingerprint(source_path))
+            manifest['images'][f'{kind}/{file}'] = entry
+
+            # Report against the variant a card-width carousel slide actually downloads
+            served = min(
+                (v for v in entry['variants'] if v['format'] == 'webp' and v['width'] >= args.report_width),
+                key=lambda v: v['width'],
+                default=max((v for v in entry['variants'] if v['format'] == 'webp'), key=lambda v: v['width']),
+            )
+            total_before += entry['bytes']
+            total_after += served['bytes']
+            saved = 1 - served['bytes'] / entry['bytes']
+            print(f"{kind + '/' + file:<60} {entry['bytes']:>10,} {served['bytes']:>12,} {saved:>7.0%}")
+
+    with open(IMAGE_MANIFEST, 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    print(f"{'total':<60} {total_before:>10,} {total_after:>12,} {1 - total_after / max(total_before, 1):>7.0%}")
+    print(f"Manifest written to {os.path.relpath(IMAGE_MANIFEST, BASE_DIR)}")
+
+
+def placeholder_uri(img):
+    """Blurred PLACEHOLDER_SIZE thumbnail of an image as a WebP data: URI, typically under 150 bytes."""
+    thumbnail = img.convert('RGB')
+    thumbnail.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE), Image.LANCZOS)
+    # The browser scales it up smoothly; a light blur hides the remaining blockiness
+    thumbnail = thumbnail.filter(ImageFilter.GaussianBlur(0.6))
+    buffer = io.BytesIO()
+    thumbnail.save(buffer, 'WEBP', quality=40)
+    return 'data:image/webp;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def build_index(args):
+    assets = {}
+    for kind in IMAGE_DIRS:
+        for file in list_images(kind):
+            entry = describe_asset(kind, file)
+            if Image is not None:
+                with Image.open(os.path.join(BASE_DIR, entry['path'])) as img:
+                    entry['width'], entry['height'] = img.size
+                    entry['placeholder'] = placeholder_uri(img)
+            assets[entry['path']] = entry
+
+    os.makedirs(os.path.dirname(ASSET_INDEX), exist_ok=True)
+    with open(ASSET_INDEX, 'w') as f:
+        json.dump({'assets': assets}, f, indent=2)
+    if Image is None:
+        print("Pillow is not installed: image dimensions and placeholders were left empty")
+    print(f"Indexed {len(assets)} images in {os.path.relpath(ASSET_INDEX, BASE_DIR)}")
+
+
+def build_compress(args):
+    total = {'identity': 0}
+    for path, size, sizes in precompress_assets():
+        total['identity'] += size
+        for encoding, compressed in sizes.items():
+            total[encoding] = total.get(encoding, 0) + compressed
+        print(f"{path:<30} {size:>10,} " + ' '.join(f"{e} {c:>8,}" for e, c in sizes.items()))
+    print(f"{'total':<30} {total.pop('identity'):>10,} " + ' '.join(f"{e} {c:>8,}" for e, c in total.items()))
+
+
+def render_pdf_page(path, width):
+    """First page of a PDF as an RGB Pillow image `width` pixels wide, or None without a renderer.
+
+    Uses PyMuPDF when it is installed and falls back to poppler's pdftoppm.
+    """
+    if pymupdf is not None:
+        with pymupdf.open(path) as doc:
+            page = doc[0]
+            scale = width / page.rect.width
+            pixmap = page.get_pixmap(matrix=pymupdf.Matrix(scale, scale))
+            return Image.frombytes('RGB', (pixmap.width, pixmap.height), pixmap.samples)
+    if shutil.which('pdftoppm'):
+        with tempfile.TemporaryDirectory() as tmp:
+            out = os.path.join(tmp, 'page')
+            subprocess.run(['pdftoppm', '-png', '-singlefile', '-f', '1', '-l', '1', '-scale-to-x', str(width),
+                            '-scale-to-y', '-1', path, out], check=True, capture_output=True)
+            with Image.open(out + '.png') as img:
+                return img.convert('RGB')
+    return None
+
+
+CERTIFICATE_RENDER_WIDTH = max(IMAGE_WIDTHS)  # `build.py images` scales the renders down from here
+
+
+def render_certificate(source_path, out_path):
+    """Render a PDF's first page to `out_path` (JPEG) and return its size; runs in the worker pool."""
+    page = render_pdf_page(source_path, CERTIFICATE_RENDER_WIDTH)
+    if page is None:
+        return None
+    page.save(out_path + '.tmp', 'JPEG', quality=90, optimize=True, progressive=True)
+    os.replace(out_path + '.tmp', out_path)
+    return page.size
+
+
+def build_certificates(args):
+    if Image is None:
+        sys.exit("Pillow is required for the certificate build: pip install Pillow")
+
+    directory, render_dir = IMAGE_DIRS['certificate'], IMAGE_DIRS['certificate-page']
+    os.makedirs(render_dir, exist_ok=True)
+    previous = portfolio.load_certificate_catalog()
+    catalog, renders = {}, {}
+    unchanged = failed = 0
+
+    for file in sorted(os.listdir(directory)):
+        if not file.lower().endswith(CERTIFICATE_EXTENSIONS):
+            continue
+        path = os.path.join(directory, file)
+        rel = os.path.relpath(path, BASE_DIR)
+        stat = os.stat(path)
+        old = previous.get(rel)
+        # Reuse an unchanged entry only while its image exists: a PDF cataloged before a renderer
+        # was installed, or whose render was deleted, is rendered again
+        if (old and (old['mtime_ns'], old['size']) == (stat.st_mtime_ns, stat.st_size) and old['image']
+                and os.path.isfile(os.path.join(IMAGE_DIRS[old['image']['kind']], old['image']['file']))):
+            catalog[rel] = old
+            unchanged += 1
+            continue
+
+        # New or changed: hash it, and render PDFs whose content has not been rendered before
+        fingerprint = file_fingerprint(path)
+        title, year = parse_title(file)
+        entry = catalog[rel] = {'source': rel, 'hash': fingerprint, 'mtime_ns': stat.st_mtime_ns,
+                                'size': stat.st_size, 'type': 'pdf' if file.lower().endswith('.pdf') else 'image',
+                                'title': title, 'year': year, 'image': None, 'width': None, 'height': None}
+        if entry['type'] == 'image':
+            image_file = file
+            entry['image'] = {'kind': 'certificate', 'file': file}
+        else:
+            image_file = f'{fingerprint}.jpg'
+            if not os.path.exists(os.path.join(render_dir, image_file)):
+                renders[rel] = image_file
+                continue
+            entry['image'] = {'kind': 'certificate-page', 'file': image_file}
+        with Image.open(os.path.join(IMAGE_DIRS[entry['image']['kind']], image_file)) as img:
+            entry['width'], entry['height'] = img.size
+
+    if renders:
+        jobs = [(os.path.join(BASE_DIR, rel), os.path.join(render_dir, out)) for rel, out in renders.items()]
+        if args.jobs > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(min(args.jobs, len(jobs))) as pool:
+                sizes = list(pool.map(render_certificate, *zip(*jobs)))
+        else:
+            sizes = [render_certificate(*job) for job in jobs]
+        for (rel, out), size in zip(renders.items(), sizes):
+            if size is None:
+                failed += 1
+                print(f"{rel}: not rendered, needs PyMuPDF (pip install pymupdf) or poppler's pdftoppm")
+                continue
+            catalog[rel].update(image={'kind': 'certificate-page', 'file': out}, width=size[0], height=size[1])
+
+    # A hand-exported '<name>_page-0001.jpg' next to '<name>.pdf' is the same certificate: show the PDF's render
+    rendered_pdfs = {os.path.splitext(e['source'])[0]: rel for rel, e in catalog.items()
+                     if e['type'] == 'pdf' and e['image']}
+    for rel, entry in catalog.items():
+        stem = os.path.splitext(entry['source'])[0]
+        exported_from = re.sub(r'[-_ ]+page[-_ ]*\d+$', '', stem, flags=re.I)
+        is_export = entry['type'] == 'image' and exported_from != stem
+        entry['duplicate_of'] = rendered_pdfs.get(exported_from) if is_export else None
+
+    # Drop renders of PDFs that were removed or changed
+    in_use = {e['image']['file'] for e in catalog.values() if e['image'] and e['image']['kind'] == 'certificate-page'}
+    removed = [f for f in os.listdir(render_dir) if f not in in_use]
+    for file in removed:
+        os.remove(os.path.join(render_dir, file))
+
+    with open(CERTIFICATE_CATALOG + '.tmp', 'w') as f:
+        json.dump({'certificates': catalog}, f, indent=2)
+    os.replace(CERTIFICATE_CATALOG + '.tmp', CERTIFICATE_CATALOG)
+
+    for rel, entry in catalog.items():
+        note = f"duplicate of {entry['duplicate_of']}" if entry['duplicate_of'] else ''
+        print(f"{rel:<60} {entry['title'] + (' ' + entry['year'] if entry['year'] else ''):<40} {note}")
+    print(f"{len(catalog)} certificates: {unchanged} unchanged, {len(catalog) - unchanged - len(renders)} re-read, "
+          f"{len(renders) - failed} rendered, {failed} not rendered, {len(removed)} stale renders removed")
+    print(f"Catalog written to {os.path.relpath(CERTIFICATE_CATALOG, BASE_DIR)}; "
+          "run `build.py images` to resize new ones")
+
+
+def build_documents(args):
+    if Image is None:
+        sys.exit("Pillow is required for the document build: pip install Pillow")
+
+    os.makedirs(DOCUMENT_BUILD_DIR, exist_ok=True)
+    manifest = {'documents': {}}
+    for version, (_, path) in RESUME_VERSIONS.items():
+        if not os.path.isfile(path):
+            continue
+        fingerprint = file_fingerprint(path)
+        variants = []
+        page = None
+        for fmt, (pil_format, ext, options) in IMAGE_FORMATS.items():
+            file = f'{fingerprint}-{DOCUMENT_PREVIEW_WIDTH}.{ext}'
+            out_path = os.path.join(DOCUMENT_BUILD_DIR, file)
+            if not os.path.exists(out_path):
+                page = page or render_pdf_page(path, DOCUMENT_PREVIEW_WIDTH)
+                if page is None:
+                    sys.exit("Rendering PDF previews needs PyMuPDF (pip install pymupdf) or poppler's pdftoppm")
+                page.save(out_path, pil_format, **options)
+            with Image.open(out_path) as img:
+                variants.append({'width': img.width, 'height': img.height, 'format': fmt, 'file': file,
+                                 'bytes': os.path.getsize(out_path)})
+        manifest['documents'][f'resume/{version}'] = {'source_hash': fingerprint, 'variants': variants}
+        print(f"resume/{version:<20} " + ' '.join(f"{v['format']} {v['bytes']:>8,}" for v in variants))
+
+    with open(DOCUMENT_MANIFEST, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    print(f"Manifest written to {os.path.relpath(DOCUMENT_MANIFEST, BASE_DIR)}")
+
+
+def minify(name, data):
+    if name.endswith('.js') and rjsmin is not None:
+        return rjsmin.jsmin(data.decode('utf-8')).encode('utf-8') + b'\n'
+    if name.endswith('.css') and rcssmin is not None:
+        return rcssmin.cssmin(data.decode('utf-8')).encode('utf-8') + b'\n'
+    return data
+
+
+def build_bundles(args):
+    if rjsmin is None:
+        print("rjsmin/rcssmin are not installed: bundles are built without minification")
+    os.makedirs(BUNDLE_BUILD_DIR, exist_ok=True)
+    manifest = {'bundles': {}}
+    for name in BUNDLES:
+        fingerprint = bundle_fingerprint(name)
+        source = concatenate_sources(name)
+        data = minify(name, source)
+        stem, ext = os.path.splitext(name)
+        file = f'{stem}.{fingerprint}.min{ext}'
+        out_path = os.path.join(BUNDLE_BUILD_DIR, file)
+        with open(out_path, 'wb') as f:
+            f.write(data)
+        sizes = {}
+        for encoding in ENCODINGS:
+            with open(out_path + ENCODING_SUFFIXES[encoding], 'wb') as f:
+                f.write(compress_bytes(data, encoding, best=True))
+            sizes[encoding] = os.path.getsize(out_path + ENCODING_SUFFIXES[encoding])
+        manifest['bundles'][name] = {'source_hash': fingerprint, 'file': file, 'bytes': len(data)}
+        print(f"{name:<20} {len(source):>8,} -> {len(data):>8,} " + ' '.join(f"{e} {c:>7,}" for e, c in sizes.items()))
+
+    with open(BUNDLE_MANIFEST, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    print(f"Manifest written to {os.path.relpath(BUNDLE_MANIFEST, BASE_DIR)}")
+
+
+# Vendoring: self-hosted copies of the CDN stylesheets, with their fonts subset
+
+VENDOR_CACHE_DIR = os.path.join(VENDOR_DIR, 'cache')
+# Google Fonts only serves WOFF2 (and unicode-range subsets) to browsers that it recognises
+BROWSER_USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
+                      'Chrome/120.0.0.0 Safari/537.36')
+# Where icon and style class names can appear
+ICON_SOURCES = [os.path.join(BASE_DIR, 'app.py'), os.path.join(BASE_DIR, 'assets', 'custom.css'),
+                os.path.join(BASE_DIR, 'data', 'content')]
+FONT_AWESOME_STYLES = {  # style class -> (font family, weight) of its webfont
+    'fas': ('Font Awesome 5 Free', '900'),
+    'far': ('Font Awesome 5 Free', '400'),
+    'fab': ('Font Awesome 5 Brands', '400'),
+}
+FONT_AWESOME_FILES = {('Font Awesome 5 Free', '900'): 'fa-solid-900', ('Font Awesome 5 Free', '400'): 'fa-regular-400',
+                      ('Font Awesome 5 Brands', '400'): 'fa-brands-400'}
+FONT_WEIGHTS = {'normal': '400', 'bold': '700'}
+SOURCE_MAP = re.compile(r'/\*# sourceMappingURL=[^*]*\*/|//# sourceMappingURL=\S*')
+
+
+def fetch(url):
+    """Body of `url`, cached under build/vendor/cache so rebuilds work offline."""
+    os.makedirs(VENDOR_CACHE_DIR, exist_ok=True)
+    cached = os.path.join(VENDOR_CACHE_DIR, hashlib.sha256(url.encode()).hexdigest()[:16])
+    if not os.path.exists(cached):
+        request = urllib.request.Request(url, headers={'User-Agent': BROWSER_USER_AGENT})
+        with urllib.request.urlopen(request, timeout=30) as response:
+            data = response.read()
+        with open(cached + '.tmp', 'wb') as f:
+            f.write(data)
+        os.replace(cached + '.tmp', cached)
+    with open(cached, 'rb') as f:
+        return f.read()
+
+
+def css_blocks(css):
+    """Top-level (prelude, body) pairs of a stylesheet, with nested blocks left inside the body."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    blocks, depth, start, prelude = [], 0, 0, ''
+    for i, char in enumerate(css):
+        if char == '{':
+            if depth == 0:
+                prelude, start = css[start:i].strip(), i + 1
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                blocks.append((prelude, css[start:i]))
+                start = i + 1
+        elif char == ';' and depth == 0:
+            blocks.append((css[start:i].strip(), None))  # @import/@charset statement
+            start = i + 1
+    return blocks
+
+
+def declarations(body):
+    return {key.strip().lower(): value.strip() for key, _, value in
+            (d.partition(':') for d in body.split(';')) if value}
+
+
+def used_class_names():
+    """Every class-like word in the sources, to match icon and style classes against."""
+    names = set()
+    for source in ICON_SOURCES:
+        paths = [os.path.join(source, f) for f in os.listdir(source)] if os.path.isdir(source) else [source]
+        for path in paths:
+            with open(path, encoding='utf-8') as f:
+                names.update(re.findall(r'\b(?:fa-[a-z0-9-]+|fa[srb]?)\b', f.read()))
+    return names
+
+
+def used_font_weights(*stylesheets):
+    weights = {'400'}
+    for css in stylesheets:
+        for value in re.findall(r'font-weight\s*:\s*([a-z0-9]+)', css):
+            value = FONT_WEIGHTS.get(value, value)
+            if value.isdigit():
+                weights.add(value)
+    return weights
+
+
+def subset_font(data, codepoints):
+    """WOFF2 font cut down to `codepoints`; the whole font when fontTools is missing."""
+    if font_subset is None:
+        return data
+    options = font_subset.Options()
+    options.flavor = 'woff2'
+    options.drop_tables += ['FFTM']  # FontForge timestamps
+    font = font_subset.load_font(io.BytesIO(data), options)
+    subsetter = font_subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+    out = io.BytesIO()
+    font_subset.save_font(font, out, options)
+    return out.getvalue()
+
+
+class Vendor:
+    """Writes the vendored stylesheets into build/vendor and their fonts into build/vendor/fonts."""
+
+    def __init__(self):
+        self.fonts = {}  # font key -> file name, for preload hints
+        self.report = []  # (file, bytes fetched, bytes written)
+
+    def save_font(self, key, data):
+        file = f'{key}.{hashlib.sha256(data).hexdigest()[:16]}.woff2'
+        with open(os.path.join(VENDOR_DIR, 'fonts', file), 'wb') as f:
+            f.write(data)
+        self.fonts[key] = file
+        return f'/vendor/fonts/{file}'
+
+    def write(self, name, text, fetched):
+        data = text.encode('utf-8')
+        with open(os.path.join(VENDOR_DIR, name), 'wb') as f:
+            f.write(data)
+        self.report.append((name, fetched, len(data)))
+
+    def bootstrap(self, url):
+        css = fetch(url).decode('utf-8')
+        # Bootswatch @imports its Lato web font, which custom.css overrides with Poppins
+        text = re.sub(r'@import\s+url\([^)]*\)\s*;', '', SOURCE_MAP.sub('', css))
+        self.write('bootstrap.css', text, len(css))
+
+    def fontawesome(self, url):
+        css = fetch(url).decode('utf-8')
+        names = used_class_names()
+        styles = {FONT_AWESOME_STYLES[s] for s in FONT_AWESOME_STYLES if s in names}
+        if 'fa' in names:
+            styles.add(FONT_AWESOME_STYLES['fas'])
+
+        rules, codepoints, fetched = [], set(), len(css)
+        blocks = css_blocks(css)
+        for prelude, body in blocks:
+            selectors = [sel.strip() for sel in prelude.split(',')]
+            if body is not None and all(re.fullmatch(r'\.fa-[a-z0-9-]+:+before', sel) for sel in selectors):
+                # Icon rule: keep it only for icons the site uses
+                selectors = [sel for sel in selectors if sel.split(':')[0][1:] in names]
+                if not selectors:
+                    continue
+                content = declarations(body).get('content', '').strip('"\'')
+                codepoints.update(int(code, 16) for code in re.findall(r'\\([0-9a-f]+)', content))
+                prelude = ','.join(selectors)
+            rules.append((prelude, body))
+
+        output = [re.search(r'/\*!.*?\*/', css, re.S).group(0)] if '/*!' in css else []
+        for prelude, body in rules:
+            if prelude == '@font-face':
+                face = declarations(body)
+                key = (face['font-family'].strip('"\''), face.get('font-weight', '400'))
+                if key not in styles:
+                    continue
+                source = urljoin(url, re.search(r'url\(([^)]*\.woff2[^)]*)\)', face['src']).group(1).strip('"\''))
+                font = fetch(source)
+                fetched += len(font)
+                font_url = self.save_font(FONT_AWESOME_FILES[key], subset_font(font, codepoints))
+                body = ';'.join([f'{k}:{v}' for k, v in face.items() if k != 'src'] +
+                                [f'src:url({font_url}) format("woff2")'])
+            output.append(f'{prelude}{{{body}}}' if body is not None else f'{prelude};')
+        self.write('fontawesome.css', '\n'.join(output), fetched)
+
+    def poppins(self, url):
+        css = fetch(url).decode('utf-8')
+        stylesheets = [os.path.join(VENDOR_DIR, 'bootstrap.css'), os.path.join(BASE_DIR, 'assets', 'custom.css')]
+        texts = []
+        for path in stylesheets:
+            if os.path.isfile(path):
+                with open(path, encoding='utf-8') as f:
+                    texts.append(f.read())
+        weights = used_font_weights(*texts)
+
+        output, fetched = [], len(css)
+        # Google labels each @font-face with its script subset; only Latin is used here
+        for subset, body in re.findall(r'/\*\s*([\w-]+)\s*\*/\s*@font-face\s*\{([^}]*)\}', css):
+            face = declarations(body)
+            weight = face.get('font-weight', '400')
+            if subset != 'latin' or weight not in weights:
+                continue
+            font = fetch(re.search(r'url\(([^)]*)\)', face['src']).group(1).strip('"\''))
+            fetched += len(font)
+            font_url = self.save_font(f'poppins-{weight}', font)
+            body = ';'.join([f'{k}:{v}' for k, v in face.items() if k != 'src'] +
+                            [f'src:url({font_url}) format("woff2")'])
+            output.append(f'@font-face{{{body}}}')
+        self.write('poppins.css', '\n'.join(output), fetched)
+
+    def script(self, name, url):
+        js = fetch(url).decode('utf-8')
+        self.write(name, SOURCE_MAP.sub('', js), len(js))
+
+
+def build_vendor(args):
+    if font_subset is None:
+        print("fontTools is not installed: Font Awesome is vendored without subsetting")
+    shutil.rmtree(os.path.join(VENDOR_DIR, 'fonts'), ignore_errors=True)
+    os.makedirs(os.path.join(VENDOR_DIR, 'fonts'))
+    vendor = Vendor()
+    steps = [('bootstrap.css', vendor.bootstrap), ('fontawesome.css', vendor.fontawesome),
+             ('poppins.css', vendor.poppins)]
+    failed = []
+    for name, step in steps:
+        try:
+            step(VENDOR_STYLESHEETS[name])
+        except (OSError, ValueError) as e:
+            failed.append(name)
+            if os.path.exists(os.path.join(VENDOR_DIR, name)):
+                os.remove(os.path.join(VENDOR_DIR, name))  # its fonts are gone
+            print(f"{name}: could not vendor {VENDOR_STYLESHEETS[name]} ({e}); it keeps loading from the CDN")
+    for name, url in VENDOR_SCRIPTS.items():
+        try:
+            vendor.script(name, url)
+        except (OSError, ValueError) as e:
+            failed.append(name)
+            print(f"{name}: could not vendor {url} ({e}); the static export keeps loading it from the CDN")
+
+    with open(VENDOR_MANIFEST, 'w') as f:
+        json.dump({'fonts': vendor.fonts}, f, indent=2)
+    for name, fetched, written in vendor.report:
+        print(f"{name:<24} {fetched:>10,} fetched (with fonts) -> {written:>8,} bytes")
+    for key, file in sorted(vendor.fonts.items()):
+        print(f"  {file:<40} {os.path.getsize(os.path.join(VENDOR_DIR, 'fonts', file)):>8,} bytes")
+    print(f"Manifest written to {os.path.relpath(VENDOR_MANIFEST, BASE_DIR)}; run `build.py bundle` next")
+    if failed:
+        sys.exit(1)
+
+
+# Static export: renders the Dash component trees to plain Bootstrap HTML
+
+CAMEL_CASE = re.compile(r'([A-Z])')
+VOID_TAGS = {'img', 'input', 'br', 'hr', 'meta', 'link', 'source', 'wbr'}
+
+# Dash-only props that have no HTML attribute counterpart
+SKIPPED_PROPS = {'children', 'n_clicks', 'n_clicks_timestamp', 'disable_n_clicks', 'loading_state', 'key',
+                 'className', 'class_name', 'style', 'external_link', 'refresh'}
+RENAMED_PROPS = {'htmlFor': 'for', 'html_for': 'for', 'srcSet': 'srcset', 'tabIndex': 'tabindex',
+                 'accessKey': 'accesskey', 'useMap': 'usemap', 'crossOrigin': 'crossorigin',
+                 'referrerPolicy': 'referrerpolicy', 'contentEditable': 'contenteditable'}
+
+CONTACT_FORM_SCRIPT = """
+document.addEventListener('click', function(e) {
+    if (!e.target.closest('#submit-button')) return;
+    e.preventDefault();
+    var fields = {name: 'contact-name', email: 'contact-email', message: 'contact-message'};
+    var body = new URLSearchParams();
+    Object.keys(fields).forEach(function(key) {
+        body.append(key, document.getElementById(fields[key]).value);
+    });
+    var alertBox = document.getElementById('contact-alert');
+    fetch(%s, {method: 'POST', body: body})
+        .then(function(r) { return r.json(); })
+        .then(function(result) {
+            alertBox.className = 'mt-2 alert alert-' + (result.ok ? 'success' : 'danger');
+            alertBox.textContent = result.message;
+            if (result.ok) document.querySelector('#contact form').reset();
+        })
+        .catch(function() {
+            alertBox.className = 'mt-2 alert alert-danger';
+            alertBox.textContent = 'Failed to send message. Please try again later.';
+        });
+});
+"""
+
+
+def class_list(*classes):
+    """Join class names, dropping empties and repeats."""
+    return ' '.join(dict.fromkeys(name for c in classes if c for name in c.split()))
+
+
+def style_attr(style):
+    """React style dict -> inline CSS, e.g. {'fontSize': '2em'} -> 'font-size: 2em'."""
+    return '; '.join(f"{CAMEL_CASE.sub(lambda m: '-' + m.group(1), key).lower()}: {value}"
+                     for key, value in style.items())
+
+
+class StaticExporter:
+    """Writes a self-contained copy of the site: HTML pages plus content-hashed assets."""
+
+    def __init__(self, out_dir, contact_endpoint):
+        self.out_dir = out_dir
+        self.asset_dir = os.path.join(out_dir, 'assets')
+        self.contact_endpoint = contact_endpoint
+        self._ids = itertools.count(1)
+        self._exported = {}
+        self._lazy_sources = {}  # lazy carousel name -> real slide URLs
+
+    # -- assets -----------------------------------------------------------
+
+    def copy_asset(self, source_path, file):
+        """Copy a file into assets/ under `file` (once) and return its URL."""
+        if source_path not in self._exported:
+            out_path = os.path.join(self.asset_dir, file)
+            os.makedirs(os.path.dirname(out_path), exist_ok=True)
+            shutil.copyfile(source_path, out_path)
+            self._exported[source_path] = f'/assets/{file}'
+        return self._exported[source_path]
+
+    def copy_hashed(self, source_path):
+        """Copy a file into assets/ with its content hash in the name and return its URL."""
+        stem, ext = os.path.splitext(os.path.basename(source_path))
+        return self.copy_asset(source_path, f'{stem}.{file_fingerprint(source_path)}{ext}')
+
+    def export_image(self, url, fmt='jpeg'):
+        """Map an /images route URL to an exported file, in `fmt` when a built variant exists."""
+        parts = urlsplit(url)
+        _, _, kind, fingerprint, filename = parts.path.split('/', 4)
+        filename = unquote(filename)
+        width = int(parse_qs(parts.query).get('w', [0])[0])
+        variant = pick_variant(image_variants(kind, filename, fingerprint), width, f'image/{fmt}') if width else None
+        if variant:
+            # Variant files are already named by content hash
+            return self.copy_asset(os.path.join(IMAGE_BUILD_DIR, variant['file']), f"img/{variant['file']}")
+        source = os.path.join(IMAGE_DIRS[kind], filename)
+        return self.copy_asset(source, f'img/{fingerprint}{os.path.splitext(filename)[1].lower()}')
+
+    def image_srcset(self, url, fmt):
+        """srcset over every built width of the image behind `url`, or None without a manifest entry."""
+        parts = urlsplit(url)
+        _, _, kind, fingerprint, filename = parts.path.split('/', 4)
+        variants = [v for v in image_variants(kind, unquote(filename), fingerprint) if v['format'] == fmt]
+        if not variants:
+            return None
+        widths = sorted(v['width'] for v in variants)
+        return ', '.join(f"{self.export_image(f'{parts.path}?w={w}', fmt)} {w}w" for w in widths)
+
+    def export_bundle(self, name):
+        """Copy a bundle, minified if `build.py bundle` has been run, and return its URL."""
+        if any(path.startswith(VENDOR_DIR) for path in BUNDLES[name]):
+            # Vendored stylesheets load their fonts from /vendor/fonts/
+            shutil.copytree(os.path.join(VENDOR_DIR, 'fonts'), os.path.join(self.out_dir, 'vendor', 'fonts'),
+                            dirs_exist_ok=True)
+        fingerprint = bundle_fingerprint(name)
+        entry = bundle_build(name, fingerprint)
+        if entry:
+            return self.copy_asset(os.path.join(BUNDLE_BUILD_DIR, entry['file']), entry['file'])
+        stem, ext = os.path.splitext(name)
+        out_path = os.path.join(self.asset_dir, f'{stem}.{fingerprint}{ext}')
+        os.makedirs(self.asset_dir, exist_ok=True)
+        with open(out_path, 'wb') as f:
+            f.write(concatenate_sources(name))
+        return f'/assets/{stem}.{fingerprint}{ext}'
+
+    def rewrite_url(self, value):
+        if value.startswith('/images/'):
+            return self.export_image(value)
+        if value.startswith('/bundles/'):
+            return self.export_bundle(value.rsplit('/', 1)[1])
+        if value.startswith('/documents/resume/'):
+            version = value.split('/')[3]
+            if value.endswith('/preview'):
+                variant = pick_variant(portfolio.resume_previews(version), DOCUMENT_PREVIEW_WIDTH, 'image/jpeg')
+                return self.copy_asset(os.path.join(DOCUMENT_BUILD_DIR, variant['file']), f"img/{variant['file']}")
+            return self.copy_hashed(RESUME_VERSIONS[version][1])
+        if value.startswith('/assets/'):
+            return self.copy_hashed(os.path.join(BASE_DIR, value.lstrip('/')))
+        return value
+
+    def picture(self, src, sizes, img_attrs):
+        """<picture> offering WebP variants with a JPEG fallback for an /images URL."""
+        img_attrs = dict(img_attrs, src=self.rewrite_url(src))
+        jpeg_srcset = self.image_srcset(src, 'jpeg') if src.startswith('/images/') else None
+        webp_srcset = self.image_srcset(src, 'webp') if src.startswith('/images/') else None
+        if jpeg_srcset:
+            img_attrs.update(srcset=jpeg_srcset, sizes=sizes)
+        img = self.tag('img', img_attrs)
+        if not webp_srcset:
+            return img
+        source = self.tag("source", {"type": "image/webp", "srcset": webp_srcset, "sizes": sizes})
+        return f'<picture>{source}{img}</picture>'
+
+    # -- components -------------------------------------------------------
+
+    def tag(self, name, attrs, inner=''):
+        rendered = ''.join(f' {key}' if value is True else f' {key}="{html.escape(str(value))}"'
+                           for key, value in attrs.items() if value is not None and value is not False)
+        if name in VOID_TAGS:
+            return f'<{name}{rendered}>'
+        return f'<{name}{rendered}>{inner}</{name}>'
+
+    def render(self, node):
+        if node is None:
+            return ''
+        if isinstance(node, (list, tuple)):
+            return ''.join(self.render(child) for child in node)
+        if isinstance(node, dict) and 'namespace' in node:
+            props = node.get('props', {})
+            if node['namespace'] == 'dash_html_components':
+                return self.render_html(node['type'], props)
+            if node['namespace'] == 'dash_bootstrap_components':
+                return self.render_dbc(node['type'], props)
+            carousel_id = props.get('id')
+            if isinstance(carousel_id, dict) and carousel_id.get('type') == 'lazy-carousel-sources':
+                self._lazy_sources[carousel_id['index']] = props['data']
+            return ''  # dcc components have no static equivalent
+        return html.escape(str(node))
+
+    def base_attrs(self, props, *classes):
+        attrs = {'class': class_list(*classes, props.get('className'), props.get('class_name')) or None}
+        if props.get('style'):
+            attrs['style'] = style_attr(props['style'])
+        return attrs
+
+    def render_html(self, component_type, props):
+        name = component_type.lower()
+        attrs = self.base_attrs(props)
+        for key, value in props.items():
+            if key in SKIPPED_PROPS:
+                continue
+            value = self.rewrite_url(value) if isinstance(value, str) and key in ('src', 'href') else value
+            attrs[RENAMED_PROPS.get(key, key)] = value
+        if name == 'img' and props.get('src', '').startswith('/images/'):
+            attrs.pop('srcset', None)
+            return self.picture(props['src'], props.get('sizes', '100vw'), attrs)
+        if name == 'script':
+            return self.tag(name, attrs, props.get('children', ''))
+        return self.tag(name, attrs, self.render(props.get('children')))
+
+    def render_dbc(self, component_type, props):
+        children = self.render(props.get('children'))
+        common = {key: props[key] for key in ('id', 'href', 'type', 'placeholder', 'rows') if key in props}
+
+        if component_type == 'Container':
+            attrs = self.base_attrs(props, 'container-fluid' if props.get('fluid') else 'container')
+        elif component_type == 'Row':
+            attrs = self.base_attrs(props, 'row')
+        elif component_type in ('Col', 'Label'):
+            sizes = []
+            for breakpoint in ('width', 'xs', 'sm', 'md', 'lg', 'xl', 'xxl'):
+                size = props.get(breakpoint)
+                if size is not None:
+                    infix = '' if breakpoint in ('width', 'xs') else f'-{breakpoint}'
+                    sizes.append(f'col{infix}-{size}')
+            if component_type == 'Label':
+                attrs = self.base_attrs(props, 'col-form-label' if sizes else 'form-label', *sizes)
+                attrs['for'] = props.get('html_for')
+                return self.tag('label', attrs, children)
+            attrs = self.base_attrs(props, *(sizes or ['col']))
+        elif component_type == 'Card':
+            attrs = self.base_attrs(props, 'card')
+        elif component_type == 'CardBody':
+            attrs = self.base_attrs(props, 'card-body')
+        elif component_type == 'Badge':
+            attrs = self.base_attrs(props, 'badge', f"bg-{props.get('color', 'secondary')}")
+            return self.tag('span', dict(attrs, **common), children)
+        elif component_type == 'Button':
+            attrs = self.base_attrs(props, 'btn', f"btn-{props.get('color', 'primary')}",
+                                    f"btn-{props['size']}" if props.get('size') else None)
+            if props.get('href'):
+                return self.tag('a', dict(attrs, role='button', **common), children)
+            return self.tag('button', dict(attrs, type='button', **common), children)
+        elif component_type == 'Form':
+            return self.tag('form', self.base_attrs(props), children)
+        elif component_type in ('Input', 'Textarea'):
+            attrs = dict(self.base_attrs(props, 'form-control'), **common)
+            return self.tag('input' if component_type == 'Input' else 'textarea', attrs)
+        elif component_type == 'Navbar':
+            color = props.get('color')
+            attrs = self.base_attrs(props, 'navbar', f"navbar-expand-{props.get('expand', 'md')}",
+                                    'navbar-dark' if props.get('dark') else 'navbar-light',
+                                    f'bg-{color}' if color else None)
+            return self.tag('nav', attrs, children)
+        elif component_type == 'NavbarBrand':
+            return self.tag('a', dict(self.base_attrs(props, 'navbar-brand'), href=props.get('href')), children)
+        elif component_type == 'NavbarToggler':
+            attrs = self.base_attrs(props, 'navbar-toggler')
+            attrs.update({'type': 'button', 'data-bs-toggle': 'collapse', 'data-bs-target': '#navbar-collapse',
+                          'aria-label': 'Toggle navigation'})
+            return self.tag('button', attrs, '<span class="navbar-toggler-icon"></span>')
+        elif component_type == 'Collapse':
+            attrs = self.base_attrs(props, 'collapse', 'navbar-collapse' if props.get('navbar') else None,
+                                    'show' if props.get('is_open') else None)
+        elif component_type == 'Nav':
+            return self.tag('ul', self.base_attrs(props, 'navbar-nav' if props.get('navbar') else 'nav'), children)
+        elif component_type == 'NavItem':
+            return self.tag('li', self.base_attrs(props, 'nav-item'), children)
+        elif component_type == 'NavLink':
+            return self.tag('a', dict(self.base_attrs(props, 'nav-link'), href=props.get('href')), children)
+        elif component_type == 'Carousel':
+            return self.render_carousel(props)
+        else:
+            attrs = self.base_attrs(props)
+        return self.tag('div', dict(attrs, id=props.get('id')), children)
+
+    def render_carousel(self, props):
+        carousel_id = props.get('id')
+        items = props['items']
+        if isinstance(carousel_id, dict):
+            # Lazy carousel: the real slide URLs were in the preceding dcc.Store
+            sources = self._lazy_sources.get(carousel_id['index'])
+            if sources:
+                items = [dict(item, src=src) for item, src in zip(items, sources)]
+            carousel_id = f"carousel-{carousel_id['index']}"
+        carousel_id = carousel_id or f'carousel-{next(self._ids)}'
+        target = f'#{carousel_id}'
+        slides, indicators = [], []
+        for i, item in enumerate(items):
+            active = 'active' if i == 0 else None
+            caption = ''
+            if item.get('header') or item.get('caption'):
+                caption = self.tag('div', {'class': 'carousel-caption d-none d-md-block'},
+                                   (self.tag('h5', {}, html.escape(item['header'])) if item.get('header') else '') +
+                                   (self.tag('p', {}, html.escape(item['caption'])) if item.get('caption') else ''))
+            img = self.picture(item['src'], '(max-width: 800px) 100vw, 800px',
+                               {'class': 'd-block w-100', 'alt': item.get('alt') or item.get('caption'),
+                                'style': style_attr(item['img_style']) if item.get('img_style') else None,
+                                'loading': None if i == 0 else 'lazy'})
+            slides.append(self.tag('div', {'class': class_list('carousel-item', active)}, img + caption))
+            indicators.append(self.tag('button', {'type': 'button', 'data-bs-target': target,
+                                                  'data-bs-slide-to': i, 'class': active,
+                                                  'aria-label': f'Slide {i + 1}'}))
+
+        controls = ''
+        if props.get('controls', True):
+            for direction, label in (('prev', 'Previous'), ('next', 'Next')):
+                controls += self.tag('button', {'class': f'carousel-control-{direction}', 'type': 'button',
+                                                'data-bs-target': target, 'data-bs-slide': direction},
+                                     f'<span class="carousel-control-{direction}-icon" aria-hidden="true"></span>'
+                                     f'<span class="visually-hidden">{label}</span>')
+        attrs = self.base_attrs(props, 'carousel', 'slide')
+        attrs.update({'id': carousel_id, 'data-bs-ride': props.get('ride') or None,
+                      'data-bs-interval': props.get('interval') or 'false'})
+        inner = (self.tag('div', {'class': 'carousel-indicators'}, ''.join(indicators))
+                 if props.get('indicators', True) else '')
+        inner += self.tag('div', {'class': 'carousel-inner'}, ''.join(slides)) + controls
+        return self.tag('div', attrs, inner)
+
+    # -- pages ------------------------------------------------------------
+
+    def page(self, content):
+        tree = json.loads(to_json_plotly([portfolio.navbar, content]))
+        body = self.render(tree)
+        stylesheets = [self.rewrite_url(sheet) for sheet in portfolio.app.config.external_stylesheets]
+        # Dash renders the collapse and carousels in the app; the static pages need Bootstrap's JavaScript
+        scripts = [self.copy_hashed(os.path.join(VENDOR_DIR, name)) if os.path.isfile(os.path.join(VENDOR_DIR, name))
+                   else url for name, url in VENDOR_SCRIPTS.items()]
+        scripts += [self.rewrite_url(script['src']) for script in portfolio.app.config.external_scripts]
+        head = ''.join(self.tag('link', {'rel': 'stylesheet', 'href': href}) for href in stylesheets)
+        tail = ''.join(self.tag('script', {'src': src, 'defer': True}) for src in scripts)
+        tail += self.tag('script', {}, CONTACT_FORM_SCRIPT % json.dumps(self.contact_endpoint))
+        return (
+            '<!DOCTYPE html>\n<html lang="en">\n<head>\n'
+            '<meta charset="utf-8">\n'
+            '<meta name="viewport" content="width=device-width, initial-scale=1">\n'
+            f'<title>{html.escape(portfolio.app.title)}</title>\n'
+            f'{head}\n'
+            f'</head>\n<body>\n{body}\n{tail}\n</body>\n</html>\n'
+        )
+
+    def write_page(self, path, content):
+        out_path = os.path.join(self.out_dir, path)
+        os.makedirs(os.path.dirname(out_path), exist_ok=True)
+        with open(out_path, 'w', encoding='utf-8') as f:
+            f.write(self.page(content))
+        return out_path
+
+
+EXPORT_MARKER = '.portfolio-export'  # written into every export so a rerun knows what it may delete
+
+
+def build_export(args):
+    if os.path.isdir(args.out) and os.listdir(args.out):
+        if not os.path.isfile(os.path.join(args.out, EXPORT_MARKER)):
+            sys.exit(f"{args.out} is not empty and does not hold a previous export; choose another --out")
+        shutil.rmtree(args.out)
+    os.makedirs(args.out, exist_ok=True)
+    with open(os.path.join(args.out, EXPORT_MARKER), 'w') as f:
+        f.write("Written by `python build.py export`; the next export deletes this directory.\n")
+    exporter = StaticExporter(args.out, args.contact_endpoint)
+    pages = [
+        exporter.write_page('index.html', portfolio.create_main_content()),
+        exporter.write_page(os.path.join('resume', 'index.html'), portfolio.create_resume_page()),
+    ]
+    pages += [exporter.write_page(os.path.join('resume', version, 'index.html'), portfolio.create_resume_page(version))
+              for version in list(RESUME_VERSIONS)[1:] if os.path.isfile(RESUME_VERSIONS[version][1])]
+    for path in pages:
+        print(f"{os.path.relpath(path, args.out):<30} {os.path.getsize(path):>10,} bytes")
+    assets = sum(os.path.getsize(os.path.join(root, f))
+                 for root, _, files in os.walk(exporter.asset_dir) for f in files)
+    print(f"{len(exporter._exported)} assets, {assets:,} bytes, written to {args.out}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    images = commands.add_parser('images', help='generate responsive image variants and their manifest')
+    images.add_argument('--report-width', type=int, default=960,
+                        help='variant width used for the bytes-saved report (default: 960)')
+    images.set_defaults(func=build_images)
+
+    index = commands.add_parser('index', help='precompute the asset index read by the app at startup')
+    index.set_defaults(func=build_index)
+
+    compress = commands.add_parser('compress', help='precompress the static assets with Brotli and gzip')
+    compress.set_defaults(func=build_compress)
+
+    vendor = commands.add_parser('vendor',
+                                 help='self-host the third-party stylesheets and fonts, subset to what is used')
+    vendor.set_defaults(func=build_vendor)
+
+    bundle = commands.add_parser('bundle', help='minify and precompress the script bundles')
+    bundle.set_defaults(func=build_bundles)
+
+    certificates = commands.add_parser('certificates', help='catalog the certificates, rendering new or changed PDFs')
+    certificates.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                              help='parallel PDF renders (default: one per CPU)')
+    certificates.set_defaults(func=build_certificates)
+
+    documents = commands.add_parser('documents', help='render first-page previews of the resume PDFs')
+    documents.set_defaults(func=build_documents)
+
+    export = commands.add_parser('export', help='render the site to static HTML for any static host or CDN')
+    export.add_argument('--out', default=os.path.join(BASE_DIR, 'dist'), help='output directory (default: dist)')
+    export.add_argument('--contact-endpoint', default='/api/contact',
+                        help='URL the contact form posts to; point it at a running app (default: /api/contact)')
+    export.set_defaults(func=build_export)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+# Gunicorn settings, picked up automatically by `gunicorn app:server`
+#
+# Every value can be overridden from the environment (or the command line):
+#   WEB_CONCURRENCY        worker processes (default: 2 x CPUs + 1, at most 8)
+#   GUNICORN_WORKER_CLASS  gthread (default) or gevent, if it is installed; gevent patches
+#                          after the preloaded app is imported, so gthread is the safer choice
+#   GUNICORN_THREADS       threads per gthread worker (default: 4)
+#   GUNICORN_MAX_REQUESTS  recycle a worker after this many requests (default: 1000, 0 disables)
+#   PORT                   listen port (default: 8050)
+#   PROXY_HOPS             reverse proxies in front of gunicorn (default: 0); set it to the
+#                          number of hops so contact limits key on the client IP from
+#                          X-Forwarded-For instead of the proxy's address
+#   RATE_LIMIT_BACKEND     where contact limits live: sqlite (default with more than one
+#                          worker, shared by all of them) or memory (per worker)
+#
+# Zero-downtime deploys: the app is preloaded in the master, so `kill -HUP` only
+# restarts workers on the code already loaded. To pick up new code, send USR2 to
+# the master (it re-execs a new master with fresh workers next to the old one),
+# then WINCH and TERM to the old master once the new one is serving.
+#
+# Point the load balancer's readiness check at /ready, which answers 503 while a
+# worker is still warming up, and its liveness check at /healthz.
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 8050)}"
+
+# Requests mostly wait on disk or on SMTP, so threads (or greenlets) per worker
+# go further than more processes; processes are capped to keep memory bounded.
+workers = int(os.environ.get('WEB_CONCURRENCY', min(multiprocessing.cpu_count() * 2 + 1, 8)))
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+worker_connections = 200  # gevent only
+
+# Recycle workers to bound slow leaks; the jitter keeps them from restarting together
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = max_requests // 10
+
+# Per-worker memory limits would let a sender through once per worker; set before the app is imported
+if workers > 1:
+    os.environ.setdefault('RATE_LIMIT_BACKEND', 'sqlite')
+
+timeout = 30
+graceful_timeout = 30
+keepalive = 5
+pidfile = os.environ.get('GUNICORN_PIDFILE')
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('LOG_LEVEL', 'info')
+
+# Import the app once in the master so workers share its memory copy-on-write
+preload_app = True
+
+
+def when_ready(server):
+    # Runs in the master after the preloaded app is imported and before any worker is forked
+    import app
+    app.preload_shared_state()
+    if server.cfg.workers > 1 and app.RATE_LIMIT_BACKEND == 'memory':
+        server.log.warning("RATE_LIMIT_BACKEND=memory with %d workers: contact limits are per worker, "
+                           "so the effective limit is %d times higher", server.cfg.workers, server.cfg.workers)
+
+
+def post_worker_init(worker):
+    # Render every route and open the SMTP pool in the background; /ready answers 503 until it is done
+    import app
+    app.warm_up.start()
+    # Deliver what an earlier worker left in the outbox (retries, dropped leases) without waiting for a new message
+    app.outbox_sender.start()
+
+
+def worker_exit(server, worker):
+    # Say goodbye to the SMTP server instead of leaving pooled connections to time out
+    import app
+    app.smtp_pool.close()